@@ -0,0 +1,31 @@
+import argparse
+import sys
+
+from main import generate_corpus
+
+
+def parse_band(text: str):
+    lo, _, hi = text.partition("-")
+    return int(lo), int(hi or lo)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Reproduzierbare 4x4-Instanzen für Lasttests erzeugen (JSON Lines).")
+    ap.add_argument("out", help="Ausgabedatei, z.B. corpus.jsonl")
+    ap.add_argument("-n", "--count", type=int, default=100)
+    ap.add_argument("--seed", default="0")
+    ap.add_argument("--mode", choices=["uniform", "h", "optimal"], default="uniform",
+                    help="uniform = gleichverteilt lösbar, h = PDB-Heuristik im Band, optimal = optimale Länge im Band")
+    ap.add_argument("--band", type=parse_band, help="z.B. 40-45 (für --mode h/optimal)")
+    ap.add_argument("-j", "--processes", type=int, default=1)
+    args = ap.parse_args()
+
+    def pcb(msg, a=0, b=0):
+        print(msg, file=sys.stderr)
+
+    generate_corpus(args.out, args.count, args.seed, mode=args.mode, band=args.band,
+                    processes=args.processes, progress_cb=pcb)
+
+
+if __name__ == "__main__":
+    main()
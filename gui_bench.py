@@ -0,0 +1,226 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEvent, QEventLoop, QObject, Qt, QTimer, Slot
+from PySide6.QtGui import QColor, QImage, QLinearGradient, QPainter
+from PySide6.QtWidgets import QApplication
+
+from main import (
+    CancelFlag, SlidingPuzzle, cached_solution, ensure_pdbs_loaded, generate_instance, ida_star_solve_pdb
+)
+from solver_service import percentiles
+
+PROBE_MS = 5
+
+
+def summary(values) -> dict:
+    return {"n": len(values), **percentiles(values), "max": round(max(values), 2) if values else 0.0}
+
+
+class Probe(QObject):
+    """Measures what the user would feel: timer lag, animation frame gaps, delivered signals."""
+
+    def __init__(self, w: SlidingPuzzle):
+        super().__init__()
+        self.w = w
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(PROBE_MS)
+        self.timer.timeout.connect(self._tick)
+        for btn in w.tiles.values():
+            btn.installEventFilter(self)
+        self.reset()
+
+    def reset(self):
+        self.lag_ms = []
+        self.frame_ms = []
+        self.progress = 0
+        self._last_tick = None
+        self._last_frame = None
+
+    def start(self):
+        self.reset()
+        self._last_tick = time.perf_counter()
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def _tick(self):
+        now = time.perf_counter()
+        self.lag_ms.append(max(0.0, (now - self._last_tick) * 1000 - PROBE_MS))
+        self._last_tick = now
+        if not self.w._animating:
+            self._last_frame = None  # the gap between two moves is not a frame
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Move and self.w._animating:
+            now = time.perf_counter()
+            # tiles of one animation group move in the same tick
+            if self._last_frame is None or now - self._last_frame > 0.0005:
+                if self._last_frame is not None:
+                    self.frame_ms.append((now - self._last_frame) * 1000)
+                self._last_frame = now
+        return False
+
+    @Slot(str)
+    def on_progress(self, msg: str):
+        self.progress += 1
+
+    def report(self, wall: float) -> dict:
+        return {
+            "wall_s": round(wall, 3),
+            "loop_lag_ms": summary(self.lag_ms),
+            "frame_interval_ms": summary(self.frame_ms),
+            "progress_signals": self.progress,
+            "progress_per_s": round(self.progress / wall, 2) if wall > 0 else 0.0,
+        }
+
+
+def wait_until(pred, timeout: float) -> bool:
+    # a nested event loop keeps animations, timers and queued signals running
+    loop = QEventLoop()
+    poll = QTimer()
+    poll.timeout.connect(lambda: pred() and loop.quit())
+    poll.start(2)
+    QTimer.singleShot(int(timeout * 1000), loop.quit)
+    if not pred():
+        loop.exec()
+    poll.stop()
+    return pred()
+
+
+def idle(w: SlidingPuzzle) -> bool:
+    return not (w._animating or w._auto_playing or w._solving)
+
+
+def make_image(path: str, width: int, height: int):
+    img = QImage(width, height, QImage.Format_RGB32)
+    p = QPainter(img)
+    grad = QLinearGradient(0, 0, width, height)
+    grad.setColorAt(0.0, QColor("#1e3a8a"))
+    grad.setColorAt(1.0, QColor("#f59e0b"))
+    p.fillRect(img.rect(), grad)
+    p.end()
+    img.save(path)
+
+
+def run_scenario(probe: Probe, fn) -> dict:
+    probe.start()
+    t0 = time.perf_counter()
+    extra = fn() or {}
+    wall = time.perf_counter() - t0
+    probe.stop()
+    return {**probe.report(wall), **extra}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Misst die GUI-Reaktionszeit (Offscreen-Qt) in festen Szenarien.")
+    ap.add_argument("-o", "--out", help="JSON-Bericht (Standard: stdout)")
+    ap.add_argument("--backend", default="auto", help="Solver-Backend für das Lösen-Szenario (z.B. python, jit)")
+    ap.add_argument("--solver", choices=["process", "thread"], default="process",
+                    help="Solver im eigenen Prozess oder im QThread")
+    ap.add_argument("--seed", default="gui-bench")
+    ap.add_argument("--band", default="40-44", help="PDB-Heuristik-Band der harten Instanz")
+    ap.add_argument("--shuffles", type=int, default=5)
+    ap.add_argument("--playback-moves", type=int, default=40, help="Länge der abgespielten Lösung (höchstens)")
+    ap.add_argument("--image-size", default="6000x4000")
+    ap.add_argument("--timeout", type=float, default=300.0, help="Timeout pro Szenario in Sekunden")
+    ap.add_argument("--only", help="kommagetrennt: shuffle,solve,playback,image")
+    args = ap.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    lo, _, hi = args.band.partition("-")
+    band = (int(lo), int(hi or lo))
+    wanted = set(args.only.split(",")) if args.only else {"shuffle", "solve", "playback", "image"}
+
+    # PDB load/build is not part of the UI measurement
+    ensure_pdbs_loaded()
+    hard = generate_instance(args.seed, 0, "h", band)["state"]
+
+    SlidingPuzzle.SOLVER_BACKEND = args.backend
+    SlidingPuzzle.SOLVER_IN_PROCESS = args.solver == "process"
+    SlidingPuzzle.CHECKPOINTS = False  # no resume dialog in a scripted run
+    w = SlidingPuzzle()
+    w.show()
+    wait_until(lambda: False, 0.2)
+    probe = Probe(w)
+    scenarios = {}
+
+    if "shuffle" in wanted:
+        def shuffle():
+            for _ in range(args.shuffles):
+                w.on_shuffle()
+                wait_until(lambda: idle(w), args.timeout)
+        scenarios["shuffle"] = run_scenario(probe, shuffle)
+
+    if "solve" in wanted:
+        def solve():
+            w.state = hard.copy()
+            w._sync_tiles_to_state(animate=False)
+            w.solver_progress.connect(probe.on_progress)
+            t0 = time.perf_counter()
+            w.on_solve()
+            ok = wait_until(lambda: not w._solving, args.timeout)
+            solve_s = time.perf_counter() - t0
+            w.solver_progress.disconnect(probe.on_progress)
+            # playback has already taken the first move off _pending_moves
+            solution = cached_solution(hard)
+            moves = len(solution) if ok and solution is not None else None
+            w.on_stop()  # playback is measured separately
+            wait_until(lambda: idle(w), args.timeout)
+            return {"completed": ok, "solve_s": round(solve_s, 3), "solution_len": moves}
+        scenarios["solve"] = run_scenario(probe, solve)
+
+    if "playback" in wanted:
+        moves = ida_star_solve_pdb(hard, CancelFlag())[:args.playback_moves]
+
+        def playback():
+            w.state = hard.copy()
+            w._sync_tiles_to_state(animate=False)
+            w._pending_moves = list(moves)
+            w._auto_playing = True
+            w._set_controls_enabled(False)
+            w._play_next_move()
+            ok = wait_until(lambda: idle(w), args.timeout)
+            return {"completed": ok, "moves": len(moves)}
+        scenarios["playback"] = run_scenario(probe, playback)
+
+    if "image" in wanted:
+        width, _, height = args.image_size.partition("x")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.png")
+            make_image(path, int(width), int(height or width))
+
+            def image():
+                ok = w.load_image(path)
+                wait_until(lambda: False, 0.1)  # let the repaint go through
+                return {"completed": ok, "image": args.image_size}
+            scenarios["image"] = run_scenario(probe, image)
+
+    w.close()
+    report = {
+        "platform": QApplication.platformName(),
+        "backend": args.backend,
+        "solver": args.solver,
+        "probe_interval_ms": PROBE_MS,
+        "anim_ms": SlidingPuzzle.ANIM_MS,
+        "scenarios": scenarios,
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0 if all(s.get("completed", True) for s in scenarios.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
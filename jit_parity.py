@@ -0,0 +1,54 @@
+import argparse
+import sys
+import time
+
+from main import (
+    HAVE_JIT, CancelFlag, ensure_pdbs_loaded, generate_instance, ida_star_solve_pdb, np
+)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Prüft, dass JIT-/Batch- und Python-Backend identische Lösungen liefern.")
+    ap.add_argument("-n", "--count", type=int, default=20)
+    ap.add_argument("--seed", default="parity")
+    ap.add_argument("--band", default="20-34", help="PDB-Heuristik-Band der Testinstanzen")
+    ap.add_argument("--backend", choices=["jit", "batched"], default="jit", help="Backend, das gegen Python geprüft wird")
+    args = ap.parse_args()
+
+    if args.backend == "jit" and not HAVE_JIT:
+        print("numba/numpy nicht installiert – nur Python-Backend verfügbar.")
+        return 1
+    if args.backend == "batched" and np is None:
+        print("numpy nicht installiert – Batch-Backend nicht verfügbar.")
+        return 1
+
+    lo, _, hi = args.band.partition("-")
+    band = (int(lo), int(hi or lo))
+    ensure_pdbs_loaded()
+
+    # warm-up: compile the kernel before timing
+    ida_star_solve_pdb(generate_instance(args.seed, -1, "h", (10, 12))["state"], CancelFlag(), backend=args.backend)
+
+    t_py = t_jit = 0.0
+    mismatches = 0
+    for i in range(args.count):
+        state = generate_instance(args.seed, i, "h", band)["state"]
+
+        t0 = time.perf_counter()
+        py = ida_star_solve_pdb(state, CancelFlag(), backend="python")
+        t1 = time.perf_counter()
+        jit = ida_star_solve_pdb(state, CancelFlag(), backend=args.backend)
+        t2 = time.perf_counter()
+        t_py += t1 - t0
+        t_jit += t2 - t1
+
+        ok = py == jit
+        mismatches += not ok
+        print(f"{i:3d}  len={len(py):2d}  python={t1 - t0:7.3f}s  {args.backend}={t2 - t1:7.3f}s  {'OK' if ok else 'MISMATCH'}")
+
+    print(f"gesamt: python={t_py:.2f}s  {args.backend}={t_jit:.2f}s  Abweichungen={mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+import argparse
+import json
+import sys
+import threading
+import time
+
+from solver_service import SolverClient, percentiles
+
+
+def load_states(path: str):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line)["state"] for line in f if line.strip()]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Lasttest für solver_service.py mit einem Korpus aus generate_corpus.py.")
+    ap.add_argument("corpus", help="JSON-Lines-Datei von generate_corpus.py")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("-c", "--clients", type=int, default=4, help="parallele Verbindungen")
+    ap.add_argument("--deadline", type=float, default=None, help="Deadline pro Anfrage in Sekunden")
+    ap.add_argument("--repeat", type=int, default=1, help="Korpus so oft durchlaufen")
+    args = ap.parse_args()
+
+    states = load_states(args.corpus) * args.repeat
+    lock = threading.Lock()
+    next_i = 0
+    latencies = []
+    counts = {}
+
+    def client_loop():
+        nonlocal next_i
+        client = SolverClient(args.host, args.port)
+        try:
+            while True:
+                with lock:
+                    if next_i >= len(states):
+                        return
+                    state = states[next_i]
+                    next_i += 1
+                t0 = time.perf_counter()
+                resp = client.solve(state, deadline=args.deadline)
+                ms = (time.perf_counter() - t0) * 1000
+                with lock:
+                    latencies.append(ms)
+                    counts[resp["status"]] = counts.get(resp["status"], 0) + 1
+        finally:
+            client.close()
+
+    t0 = time.perf_counter()
+    threads = [threading.Thread(target=client_loop) for _ in range(args.clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - t0
+
+    client = SolverClient(args.host, args.port)
+    server_metrics = client.metrics()
+    client.close()
+
+    report = {
+        "requests": len(latencies),
+        "clients": args.clients,
+        "wall_s": round(wall, 3),
+        "throughput_rps": round(len(latencies) / wall, 2) if wall > 0 else 0.0,
+        "latency_ms": percentiles(latencies),
+        "counts": counts,
+        "server": server_metrics,
+    }
+    json.dump(report, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
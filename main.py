@@ -1,11 +1,25 @@
 import sys
 import os
+import json
 import random
+import struct
+import threading
 import time
 from collections import deque
 from array import array
 from typing import List, Optional, Tuple, Dict
 
+# Optional: NumPy (batched search) and Numba (JIT search kernel)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    from numba import njit
+    HAVE_JIT = np is not None
+except ImportError:
+    HAVE_JIT = False
+
 from PySide6.QtCore import (
     Qt, QRect, QEasingCurve, QPropertyAnimation, QParallelAnimationGroup, QTimer, QSize,
     QObject, QThread, Signal, Slot
@@ -186,7 +200,214 @@ def build_pdb(pattern_tiles: Tuple[int, ...], progress_cb=None, cancel_cb=None)
 
     return dist
 
-def load_or_build_pdb(pattern_tiles: Tuple[int, ...], progress_cb=None, cancel_cb=None) -> array:
+
+# -----------------------------
+# External-memory PDB build (bounded RAM, resumable)
+# Same distances as build_pdb, but BFS layers live in sorted rank files.
+# Blank moves cost 0 and are reversible, so all states of a blank-move
+# component share one distance:
+#   L[d+1] = closure0( succ1(L[d]) - L[d] - L[d-1] )
+# -----------------------------
+
+PDB_RAM_BUDGET_MB = int(os.environ.get("PDB_RAM_BUDGET_MB", "0"))  # > 0: external build
+
+_RANK_BLOCK = 1 << 16  # ranks per read from a layer/run file
+
+def unrank_partial_perm(rank: int, m: int, n: int = 16) -> List[int]:
+    used = [False] * n
+    positions = []
+    for i in range(m):
+        w = perm_count(n - (i + 1), m - (i + 1))
+        c, rank = divmod(rank, w)
+        for p in range(n):
+            if not used[p]:
+                if c == 0:
+                    break
+                c -= 1
+        used[p] = True
+        positions.append(p)
+    return positions
+
+def _closure0(positions: List[int]) -> List[int]:
+    """Ranks of all states reachable from `positions` by blank moves only."""
+    occupied = set(positions[1:])
+    rest = positions[1:]
+    seen = {positions[0]}
+    stack = [positions[0]]
+    while stack:
+        b = stack.pop()
+        for nb in NEIGHBORS[b]:
+            if nb not in occupied and nb not in seen:
+                seen.add(nb)
+                stack.append(nb)
+    return [rank_partial_perm([b] + rest) for b in seen]
+
+def _read_ranks(fn: str):
+    with open(fn, "rb") as f:
+        while True:
+            block = array('Q')
+            try:
+                block.fromfile(f, _RANK_BLOCK)
+            except EOFError:
+                pass  # partial last block is kept in `block`
+            if not block:
+                return
+            yield from block
+
+def _write_sorted_run(ranks: array, fn: str):
+    if np is not None:
+        np.unique(np.frombuffer(ranks, dtype=np.uint64)).tofile(fn)
+    else:
+        with open(fn, "wb") as f:
+            array('Q', sorted(set(ranks))).tofile(f)
+
+def _merge_runs(run_files: List[str], out_fn: str, exclude: List[str]) -> int:
+    """k-way merge of sorted runs, dropping duplicates and ranks found in `exclude` (sorted files)."""
+    import heapq
+    excl = [_read_ranks(fn) for fn in exclude if os.path.exists(fn)]
+    heads = [next(it, None) for it in excl]
+    out = array('Q')
+    count = 0
+    last = None
+    with open(out_fn + ".tmp", "wb") as f:
+        for r in heapq.merge(*[_read_ranks(fn) for fn in run_files]):
+            if r == last:
+                continue
+            last = r
+            skip = False
+            for i, it in enumerate(excl):
+                while heads[i] is not None and heads[i] < r:
+                    heads[i] = next(it, None)
+                if heads[i] == r:
+                    skip = True
+            if skip:
+                continue
+            out.append(r)
+            count += 1
+            if len(out) >= _RANK_BLOCK:
+                out.tofile(f)
+                del out[:]
+        out.tofile(f)
+    os.replace(out_fn + ".tmp", out_fn)
+    return count
+
+def build_pdb_external(pattern_tiles: Tuple[int, ...], ram_budget_mb: int = 256,
+                       progress_cb=None, cancel_cb=None) -> str:
+    """
+    Build the PDB for `pattern_tiles` with at most ~ram_budget_mb of working set.
+    Layers go to pdb_cache/<name>.ext/; after an interruption (cancel, crash)
+    calling this again continues after the last finished layer.
+    Returns the path of the finished PDB file (same format as the pdb_cache/ files).
+    """
+    m = 1 + len(pattern_tiles)
+    size = perm_count(16, m)
+    fn = pdb_filename(pattern_tiles)
+    work = fn[:-len(".bin")] + ".ext"
+    os.makedirs(work, exist_ok=True)
+    state_fn = os.path.join(work, "state.json")
+    layer_fn = lambda d: os.path.join(work, f"layer_{d}.bin")
+
+    budget = max(1, ram_budget_mb) * 1024 * 1024
+    # sorted(set(...)) costs far more than 8 bytes per rank
+    run_entries = max(1024, budget // (16 if np is not None else 96))
+
+    def check_cancel():
+        if cancel_cb and cancel_cb():
+            raise RuntimeError("CANCELLED")
+
+    def spill(gen, out_fn: str, exclude: List[str]) -> int:
+        runs = []
+        buf = array('Q')
+        for i, r in enumerate(gen):
+            buf.append(r)
+            if len(buf) >= run_entries:
+                runs.append(os.path.join(work, f"run_{len(runs)}.bin"))
+                _write_sorted_run(buf, runs[-1])
+                buf = array('Q')
+                check_cancel()
+        runs.append(os.path.join(work, f"run_{len(runs)}.bin"))
+        _write_sorted_run(buf, runs[-1])
+        n = _merge_runs(runs, out_fn, exclude)
+        for r in runs:
+            os.remove(r)
+        return n
+
+    # resume
+    done = -1
+    total = 0
+    if os.path.exists(state_fn):
+        with open(state_fn, encoding="utf-8") as f:
+            st = json.load(f)
+        done, total = st["done"], st["states"]
+
+    def save_state(d: int, states: int, finished: bool = False):
+        with open(state_fn + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"pattern": list(pattern_tiles), "done": d, "states": states, "finished": finished}, f)
+        os.replace(state_fn + ".tmp", state_fn)
+
+    if done < 0:
+        start = [GOAL_POS[0]] + [GOAL_POS[t] for t in pattern_tiles]
+        total = spill(iter(_closure0(start)), layer_fn(0), [])
+        done = 0
+        save_state(0, total)
+
+    finished = os.path.getsize(layer_fn(done)) == 0
+    while not finished:
+        check_cancel()
+        d = done
+
+        def succ1():
+            for r in _read_ranks(layer_fn(d)):
+                pos = unrank_partial_perm(r, m)
+                b = pos[0]
+                for nb in NEIGHBORS[b]:
+                    if nb in pos:
+                        i = pos.index(nb)
+                        new_pos = pos[:]
+                        new_pos[0], new_pos[i] = nb, b
+                        yield rank_partial_perm(new_pos)
+
+        seeds_fn = os.path.join(work, "seeds.bin")
+        spill(succ1(), seeds_fn, [layer_fn(d), layer_fn(d - 1)])
+
+        def members():
+            for r in _read_ranks(seeds_fn):
+                yield from _closure0(unrank_partial_perm(r, m))
+
+        n = spill(members(), layer_fn(d + 1), [])
+        os.remove(seeds_fn)
+        total += n
+        done = d + 1
+        save_state(done, total)
+        finished = n == 0
+        if progress_cb:
+            progress_cb(f"PDB {pattern_tiles} (extern): Tiefe {done} ({total:,} Zustände)", total, size)
+
+    # distances, written chunk by chunk
+    check_cancel()
+    chunk = max(1024, budget // 2)
+    readers = [_read_ranks(layer_fn(d)) for d in range(done)]
+    heads = [next(it, None) for it in readers]
+    with open(fn + ".tmp", "wb") as f:
+        for lo in range(0, size, chunk):
+            hi = min(size, lo + chunk)
+            dist = array('H', [65535]) * (hi - lo)
+            for d, it in enumerate(readers):
+                while heads[d] is not None and heads[d] < hi:
+                    dist[heads[d] - lo] = d
+                    heads[d] = next(it, None)
+            dist.tofile(f)
+            if progress_cb:
+                progress_cb(f"PDB {pattern_tiles} (extern): schreibe Distanzen…", hi, size)
+    os.replace(fn + ".tmp", fn)
+
+    import shutil
+    shutil.rmtree(work, ignore_errors=True)
+    if progress_cb:
+        progress_cb(f"PDB {pattern_tiles}: fertig.", size, size)
+    return fn
+
+def _load_or_build_pdb_file(pattern_tiles: Tuple[int, ...], progress_cb=None, cancel_cb=None) -> array:
     os.makedirs("pdb_cache", exist_ok=True)
     fn = pdb_filename(pattern_tiles)
     m = 1 + len(pattern_tiles)
@@ -209,18 +430,164 @@ def load_or_build_pdb(pattern_tiles: Tuple[int, ...], progress_cb=None, cancel_c
     if progress_cb:
         progress_cb(f"PDB {pattern_tiles}: Cache fehlt/kaputt → baue neu…", 0, expected_size)
 
+    if PDB_RAM_BUDGET_MB > 0:
+        build_pdb_external(pattern_tiles, PDB_RAM_BUDGET_MB, progress_cb=progress_cb, cancel_cb=cancel_cb)
+        with open(fn, "rb") as f:
+            a = array('H')
+            a.fromfile(f, expected_size)
+        return a
+
     a = build_pdb(pattern_tiles, progress_cb=progress_cb, cancel_cb=cancel_cb)
-    with open(fn, "wb") as f:
+    # write + rename: concurrent readers (background build) never see half a file
+    with open(fn + ".tmp", "wb") as f:
         a.tofile(f)
+    os.replace(fn + ".tmp", fn)
     return a
 
+
+# -----------------------------
+# PDB cache manager (RAM budget + disk quota, LRU)
+# -----------------------------
+
+class PDBCacheManager:
+    """
+    Loads PDBs on demand and keeps at most ram_budget_mb resident / disk_quota_mb
+    in pdb_cache/ (0 = unlimited). Least recently used tables are evicted first;
+    tables currently installed in PDBS are never evicted from RAM or disk.
+    """
+    def __init__(self, ram_budget_mb: int = 0, disk_quota_mb: int = 0):
+        from collections import OrderedDict
+        self.ram_budget = ram_budget_mb * 1024 * 1024
+        self.disk_quota = disk_quota_mb * 1024 * 1024
+        self._resident = OrderedDict()  # pattern -> array, oldest first
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+        self.load_seconds = 0.0
+        self.ram_evictions = 0
+        self.disk_evictions = 0
+
+    def _pinned(self, pattern_tiles) -> bool:
+        return pattern_tiles in PDBS and PDBS[pattern_tiles] is self._resident.get(pattern_tiles)
+
+    def get(self, pattern_tiles: Tuple[int, ...], progress_cb=None, cancel_cb=None) -> array:
+        pattern_tiles = tuple(pattern_tiles)
+        a = self._resident.get(pattern_tiles)
+        if a is not None:
+            self.hits += 1
+            self._resident.move_to_end(pattern_tiles)
+            self._touch(pattern_tiles)
+            return a
+
+        self.misses += 1
+        fn = pdb_filename(pattern_tiles)
+        had_file = os.path.exists(fn) and os.path.getsize(fn) == 2 * perm_count(16, 1 + len(pattern_tiles))
+        t0 = time.time()
+        a = _load_or_build_pdb_file(pattern_tiles, progress_cb=progress_cb, cancel_cb=cancel_cb)
+        self.load_seconds += time.time() - t0
+        if not had_file:
+            self.builds += 1
+
+        self._resident[pattern_tiles] = a
+        self._touch(pattern_tiles)
+        self._evict_ram(keep=pattern_tiles)
+        if not had_file:
+            self._evict_disk(keep=pattern_tiles)
+        return a
+
+    def _touch(self, pattern_tiles):
+        # file mtime = last use, so the disk LRU survives restarts
+        try:
+            os.utime(pdb_filename(pattern_tiles))
+        except OSError:
+            pass
+
+    def _evict_ram(self, keep):
+        if not self.ram_budget:
+            return
+        for p in list(self._resident):
+            if self.resident_bytes() <= self.ram_budget:
+                break
+            if p == keep or self._pinned(p):
+                continue
+            del self._resident[p]
+            self.ram_evictions += 1
+
+    def _evict_disk(self, keep):
+        if not self.disk_quota:
+            return
+        files = []
+        cache_dir = os.path.dirname(pdb_filename(keep))  # where tables are written
+        for name in os.listdir(cache_dir):
+            if name.startswith("pdb_") and name.endswith(".bin"):
+                path = os.path.join(cache_dir, name)
+                files.append((os.path.getmtime(path), os.path.getsize(path), path))
+        files.sort()
+        protected = {os.path.normpath(pdb_filename(p)) for p in list(PDBS) + [keep]}
+        used = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if used <= self.disk_quota:
+                break
+            if os.path.normpath(path) in protected:
+                continue
+            os.remove(path)
+            used -= size
+            self.disk_evictions += 1
+
+    def drop(self, pattern_tiles):
+        self._resident.pop(tuple(pattern_tiles), None)
+
+    def resident_bytes(self) -> int:
+        return sum(a.itemsize * len(a) for a in self._resident.values())
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "builds": self.builds,
+            "load_seconds": round(self.load_seconds, 3),
+            "ram_evictions": self.ram_evictions,
+            "disk_evictions": self.disk_evictions,
+            "resident": {"_".join(map(str, p)): a.itemsize * len(a) for p, a in self._resident.items()},
+            "resident_bytes": self.resident_bytes(),
+            "ram_budget_bytes": self.ram_budget,
+            "disk_quota_bytes": self.disk_quota,
+        }
+
+PDB_CACHE = PDBCacheManager(
+    ram_budget_mb=int(os.environ.get("PDB_CACHE_RAM_MB", "0")),
+    disk_quota_mb=int(os.environ.get("PDB_CACHE_DISK_MB", "0")),
+)
+
+def load_or_build_pdb(pattern_tiles: Tuple[int, ...], progress_cb=None, cancel_cb=None) -> array:
+    return PDB_CACHE.get(pattern_tiles, progress_cb=progress_cb, cancel_cb=cancel_cb)
+
 PDBS: Dict[Tuple[int, ...], array] = {}
 
+# If set, ensure_pdbs_loaded() first tries to attach to a SharedPDBRegistry of this name
+PDB_SHM_NAME = os.environ.get("PDB_SHM_NAME", "")
+
 def ensure_pdbs_loaded(progress_cb=None, cancel_cb=None):
+    if PDB_SHM_NAME and any(p not in PDBS for p in PATTERNS):
+        try:
+            attach_shared_pdbs(PDB_SHM_NAME)
+        except FileNotFoundError:
+            pass
     for p in PATTERNS:
         if p not in PDBS:
             PDBS[p] = load_or_build_pdb(p, progress_cb=progress_cb, cancel_cb=cancel_cb)
 
+def pdb_components(state: Tuple[int, ...]) -> List[int]:
+    """Per-pattern terms of pdb_heuristic, in PDBS order."""
+    pos_of = [0] * 16
+    for idx, v in enumerate(state):
+        pos_of[v] = idx
+    out = []
+    for pattern_tiles, pdb in PDBS.items():
+        d = pdb[rank_partial_perm([pos_of[0]] + [pos_of[t] for t in pattern_tiles])]
+        out.append(d if d != 65535 else 0)
+    return out
+
 def pdb_heuristic(state: Tuple[int, ...]) -> int:
     pos_of = [0] * 16
     for idx, v in enumerate(state):
@@ -237,6 +604,344 @@ def pdb_heuristic(state: Tuple[int, ...]) -> int:
     return h
 
 
+# -----------------------------
+# Walking distance
+# Rows (and, by symmetry, columns) as a 4x4 occupancy matrix: how many
+# tiles of goal row g sit in row r. Blank moves between rows carry one
+# tile along; BFS over all ~25k matrices gives the vertical resp.
+# horizontal moves needed. Builds in well under a second, so it covers
+# the cold start while the PDBs are still being built.
+# -----------------------------
+
+WD_TABLE: Optional[Dict[int, int]] = None  # matrix key -> walking distance
+
+# key = blank row + sum of per-tile weights (3 bits per matrix cell, above 2 bits of blank row)
+_WD_ROW_KEY = [[0 if t == 0 else 1 << (2 + 3 * (4 * (i // N) + (t - 1) // N)) for t in range(16)] for i in range(16)]
+_WD_COL_KEY = [[0 if t == 0 else 1 << (2 + 3 * (4 * (i % N) + (t - 1) % N)) for t in range(16)] for i in range(16)]
+
+def _wd_key(matrix: Tuple[int, ...], blank_row: int) -> int:
+    key = blank_row
+    for i, n in enumerate(matrix):
+        key += n << (2 + 3 * i)
+    return key
+
+def build_wd_table() -> Dict[int, int]:
+    goal = tuple(N if r == g else 0 for r in range(N) for g in range(N))
+    goal = goal[:15] + (N - 1,)  # blank row: only 3 tiles
+    table = {_wd_key(goal, N - 1): 0}
+    queue = deque([(goal, N - 1, 0)])
+    while queue:
+        m, b, d = queue.popleft()
+        for nb in (b - 1, b + 1):
+            if not 0 <= nb < N:
+                continue
+            for g in range(N):
+                if m[nb * N + g] == 0:
+                    continue
+                m2 = list(m)
+                m2[nb * N + g] -= 1
+                m2[b * N + g] += 1
+                key = _wd_key(m2, nb)
+                if key not in table:
+                    table[key] = d + 1
+                    queue.append((tuple(m2), nb, d + 1))
+    return table
+
+def ensure_wd_table() -> Dict[int, int]:
+    global WD_TABLE
+    if WD_TABLE is None:
+        WD_TABLE = build_wd_table()
+    return WD_TABLE
+
+def wd_heuristic(state: Tuple[int, ...]) -> int:
+    table = WD_TABLE if WD_TABLE is not None else ensure_wd_table()
+    kr = kc = 0
+    for idx, t in enumerate(state):
+        if t:
+            kr += _WD_ROW_KEY[idx][t]
+            kc += _WD_COL_KEY[idx][t]
+        else:
+            kr += idx // N
+            kc += idx % N
+    return table[kr] + table[kc]
+
+def wd_pdb_heuristic(state: Tuple[int, ...]) -> int:
+    """max(WD, PDB); the PDB part sums whatever tables are loaded, so it is admissible at any time."""
+    return max(wd_heuristic(state), pdb_heuristic(state)) if PDBS else wd_heuristic(state)
+
+def _pdb_file_complete(pattern_tiles: Tuple[int, ...]) -> bool:
+    fn = pdb_filename(pattern_tiles)
+    return os.path.exists(fn) and os.path.getsize(fn) == perm_count(16, 1 + len(pattern_tiles)) * 2
+
+def pdbs_ready() -> bool:
+    """True if all PDBs are in memory or can be loaded without building."""
+    return all(p in PDBS or _pdb_file_complete(p) for p in PATTERNS)
+
+def _build_pdb_files():
+    for p in PATTERNS:
+        if not _pdb_file_complete(p):
+            _load_or_build_pdb_file(p)
+
+_PDB_BUILDER = None
+
+def start_background_pdb_build():
+    """Build missing PDB cache files in a separate process (at most one per process)."""
+    global _PDB_BUILDER
+    import multiprocessing
+    if multiprocessing.current_process().daemon:
+        return None  # daemonic workers cannot have children; their owner builds (SolverProcess)
+    if _PDB_BUILDER is None or not _PDB_BUILDER.is_alive():
+        _PDB_BUILDER = multiprocessing.get_context("spawn").Process(target=_build_pdb_files, daemon=True)
+        _PDB_BUILDER.start()
+    return _PDB_BUILDER
+
+
+# -----------------------------
+# Shared-memory PDB registry
+# One process publishes the tables into multiprocessing.shared_memory,
+# other processes attach read-only by name (no private copies).
+# A reference count in a small control segment decides who unlinks.
+# -----------------------------
+
+class SharedPDBRegistry:
+    CTL_SIZE = 4  # int32 refcount; the segment is created last, so it also marks "ready"
+
+    def __init__(self, name: str = "pdb15", patterns=None):
+        self.name = name
+        self.patterns = [tuple(p) for p in (patterns or PATTERNS)]
+        self._segments = {}
+        self._views: Dict[Tuple[int, ...], memoryview] = {}
+        self._ctl = None
+
+    def _segment_name(self, pattern_tiles: Tuple[int, ...]) -> str:
+        return f"{self.name}_" + "_".join(map(str, pattern_tiles))
+
+    @staticmethod
+    def _open(name: str, create: bool = False, size: int = 0):
+        from multiprocessing import shared_memory
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=create, size=size, track=False)
+        except TypeError:
+            # Python < 3.13: untrack by hand, otherwise the resource tracker
+            # unlinks the segment when *this* process exits.
+            shm = shared_memory.SharedMemory(name=name, create=create, size=size)
+            if os.name == "posix":
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+    @staticmethod
+    def _unlink(shm):
+        if os.name == "posix" and sys.version_info < (3, 13):
+            # unlink() unregisters from the tracker; re-register what _open() removed
+            from multiprocessing import resource_tracker
+            resource_tracker.register(shm._name, "shared_memory")
+        shm.unlink()
+
+    # ---------- cross-process lock (OS file lock, works without a common parent) ----------
+    # flock/msvcrt locks belong to the open file, so the OS drops them when the
+    # holder dies; a crashed worker cannot leave a stale lock behind.
+
+    def _lock(self, timeout: float = 30.0) -> int:
+        os.makedirs("pdb_cache", exist_ok=True)
+        fn = os.path.join("pdb_cache", f"{self.name}.lock")
+        fd = os.open(fn, os.O_CREAT | os.O_RDWR)
+        t0 = time.time()
+        while True:
+            try:
+                if os.name == "nt":
+                    import msvcrt
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                else:
+                    import fcntl
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return fd
+            except OSError:
+                if time.time() - t0 > timeout:
+                    os.close(fd)
+                    raise TimeoutError(f"registry lock {fn} held too long")
+                time.sleep(0.01)
+
+    @staticmethod
+    def _unlock(fd: int):
+        if os.name == "nt":
+            import msvcrt
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        os.close(fd)  # also releases the flock
+
+    def _add_ref(self, delta: int) -> int:
+        refs = struct.unpack_from("i", self._ctl.buf, 0)[0] + delta
+        struct.pack_into("i", self._ctl.buf, 0, refs)
+        return refs
+
+    # ---------- public API ----------
+
+    def publish(self, progress_cb=None, cancel_cb=None):
+        """Load/build the PDBs into shared memory (or attach if already published)."""
+        lock = self._lock()
+        try:
+            try:
+                self._ctl = self._open(f"{self.name}_ctl")
+            except FileNotFoundError:
+                self._ctl = None
+            if self._ctl is None:
+                for p in self.patterns:
+                    size = perm_count(16, 1 + len(p))
+                    shm = self._open(self._segment_name(p), create=True, size=size * 2)
+                    self._segments[p] = shm
+                    fn = pdb_filename(p)
+                    if os.path.exists(fn) and os.path.getsize(fn) == size * 2:
+                        # straight from the cache file, no intermediate copy
+                        if progress_cb:
+                            progress_cb(f"PDB {p}: lade Cache in Shared Memory…", 0, size)
+                        with open(fn, "rb") as f:
+                            f.readinto(shm.buf)
+                    else:
+                        a = _load_or_build_pdb_file(p, progress_cb=progress_cb, cancel_cb=cancel_cb)
+                        shm.buf[:size * 2] = memoryview(a).cast("B")
+                        del a
+                self._ctl = self._open(f"{self.name}_ctl", create=True, size=self.CTL_SIZE)
+                struct.pack_into("i", self._ctl.buf, 0, 0)
+            self._add_ref(+1)
+        finally:
+            self._unlock(lock)
+        self._map_views()
+        return self
+
+    def attach(self):
+        """Attach read-only to a published registry. Raises FileNotFoundError if missing."""
+        lock = self._lock()
+        try:
+            self._ctl = self._open(f"{self.name}_ctl")
+            self._add_ref(+1)
+        finally:
+            self._unlock(lock)
+        self._map_views()
+        return self
+
+    def _map_views(self):
+        for p in self.patterns:
+            if p not in self._segments:
+                self._segments[p] = self._open(self._segment_name(p))
+            size = perm_count(16, 1 + len(p))
+            buf = self._segments[p].buf[:size * 2]
+            self._views[p] = buf.toreadonly().cast("H")
+
+    def install(self):
+        """Make pdb_heuristic / the solvers use the shared tables."""
+        PDBS.update(self._views)
+        return self
+
+    def close(self, unlink: bool = False):
+        """
+        Detach; the last reference unlinks the segments.
+        unlink=True unlinks regardless (owner of a worker pool whose workers
+        get terminated without detaching). Existing mappings stay valid.
+        """
+        if self._ctl is None:
+            return
+        for p, view in self._views.items():
+            if PDBS.get(p) is view:
+                del PDBS[p]
+            view.release()
+        self._views.clear()
+
+        lock = self._lock()
+        try:
+            last = self._add_ref(-1) <= 0 or unlink
+            for shm in self._segments.values():
+                shm.close()
+                if last:
+                    self._unlink(shm)
+            self._ctl.close()
+            if last:
+                self._unlink(self._ctl)
+        finally:
+            self._unlock(lock)
+        self._segments.clear()
+        self._ctl = None
+
+    def discard(self):
+        """
+        Clean up after an owner that died while publishing: unlink whatever
+        segments exist under this name.
+        """
+        for seg in [self._segment_name(p) for p in self.patterns] + [f"{self.name}_ctl"]:
+            try:
+                shm = self._open(seg)
+            except FileNotFoundError:
+                continue
+            shm.close()
+            self._unlink(shm)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+_SHARED_REGISTRY: Optional[SharedPDBRegistry] = None
+
+def attach_shared_pdbs(name: str):
+    """Attach this process to a published registry and install its tables (idempotent)."""
+    global _SHARED_REGISTRY
+    if _SHARED_REGISTRY is None:
+        _SHARED_REGISTRY = SharedPDBRegistry(name).attach().install()
+    return _SHARED_REGISTRY
+
+
+# -----------------------------
+# IDA* checkpoints
+# IDA* state is small: bound, move path and per-depth cursors (number of
+# children already done, children in heuristic order). The python and jit
+# backends order children identically, so a checkpoint of one resumes in
+# the other. Keyed by start state + pattern set.
+# -----------------------------
+
+CHECKPOINT_DIR = os.environ.get("IDA_CHECKPOINT_DIR", "checkpoints")
+CHECKPOINT_INTERVAL_S = 10.0
+
+def _checkpoint_key(start: List[int]) -> Dict[str, object]:
+    return {"start": list(start), "patterns": [list(p) for p in PATTERNS]}
+
+def checkpoint_path(start: List[int]) -> str:
+    import hashlib
+    blob = json.dumps(_checkpoint_key(start), sort_keys=True).encode()
+    return os.path.join(CHECKPOINT_DIR, hashlib.sha1(blob).hexdigest()[:20] + ".json")
+
+def load_checkpoint(start: List[int]) -> Optional[Dict[str, object]]:
+    try:
+        with open(checkpoint_path(start), encoding="utf-8") as f:
+            cp = json.load(f)
+    except (OSError, ValueError):
+        return None
+    key = _checkpoint_key(start)
+    if cp.get("start") != key["start"] or cp.get("patterns") != key["patterns"]:
+        return None
+    return cp
+
+def save_checkpoint(start: List[int], cp: Dict[str, object]):
+    os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+    fn = checkpoint_path(start)
+    with open(fn + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({**_checkpoint_key(start), **cp, "saved": time.time()}, f)
+    os.replace(fn + ".tmp", fn)
+
+def discard_checkpoint(start: List[int]):
+    try:
+        os.remove(checkpoint_path(start))
+    except FileNotFoundError:
+        pass
+
+def checkpoints_supported(backend: str = "auto") -> bool:
+    """Whether ida_star_solve_pdb(backend=..., checkpoint=True) actually checkpoints."""
+    if backend == "auto":
+        # auto: jit, else batched (no checkpoints) with numpy, else python; wd on a cold start
+        return pdbs_ready() and (HAVE_JIT or np is None)
+    return backend in ("python", "jit")
+
+
 # -----------------------------
 # IDA* with PDB (thread-friendly + cancel + progress)
 # -----------------------------
@@ -249,89 +954,940 @@ class CancelFlag:
     def is_cancelled(self) -> bool:
         return self._cancel
 
+class SearchContext:
+    """Depth-first part of IDA* (pure Python); keeps node count + progress pacing."""
+    def __init__(self, cancel: CancelFlag, progress_cb=None, heuristic=pdb_heuristic):
+        self.cancel = cancel
+        self.progress_cb = progress_cb
+        self.heuristic = heuristic
+        self.goal_t = tuple(GOAL)
+        # To show progress
+        self.nodes = 0
+        self.last_ping = time.time()
+        # checkpoints: cursors[g] = children done at depth g, iter_min = smallest pruned f
+        self.cursors: List[int] = []
+        self.iter_min = 10**9
+        self.resume: Optional[Tuple[List[int], List[int]]] = None  # (cursors, path) to replay
+        self.checkpoint_cb = None
+        self.last_checkpoint = time.time()
+
+    def _child_h(self, state: Tuple[int, ...], prev_blank: int) -> int:
+        return self.heuristic(state)
+
+    def _children(self, state: Tuple[int, ...], blank_idx: int,
+                  prev_blank: int) -> List[Tuple[int, int, int, Tuple[int, ...]]]:
+        """(h, blank target, moved tile, child) in search order: lowest h first (stable)."""
+        cand = []
+        for nb in NEIGHBORS[blank_idx]:
+            if nb == prev_blank:
+                continue
+            new_state = list(state)
+            new_state[blank_idx], new_state[nb] = new_state[nb], new_state[blank_idx]
+            new_t = tuple(new_state)
+            cand.append((self._child_h(new_t, blank_idx), nb, state[nb], new_t))
+        cand.sort(key=lambda x: x[0])
+        return cand
+
+    # per-node hooks (ProfilingSearchContext counts here)
+    def _on_prune(self, g: int, f: int):
+        if f < self.iter_min:
+            self.iter_min = f
+
+    def _on_expand(self, state: Tuple[int, ...], g: int, h: int):
+        pass
+
+    def search(self, state: Tuple[int, ...], g: int, bound: int, blank_idx: int, prev_blank: int,
+               path_moves: List[int]) -> Tuple[bool, int]:
+        if self.cancel.is_cancelled():
+            raise RuntimeError("CANCELLED")
+
+        h = self.heuristic(state)
+        f = g + h
+        if f > bound:
+            self._on_prune(g, f)
+            return False, f
+        if state == self.goal_t:
+            return True, g
+
+        self.nodes += 1
+        self._on_expand(state, g, h)
+        skip = 0
+        if self.resume is not None:
+            cursors, saved_path = self.resume
+            if g < len(saved_path):
+                skip = cursors[g] - 1  # continue inside the child on the saved path
+            else:
+                skip = cursors[g]
+                self.resume = None
+        self.cursors[g] = skip
+
+        now = time.time()
+        if (self.progress_cb or self.checkpoint_cb) and (now - self.last_ping) > 0.2:
+            self.last_ping = now
+            if self.progress_cb:
+                self.progress_cb(f"Suche… bound={bound} | Tiefe={g} | Knoten={self.nodes:,}", 0, 0)
+            if (self.checkpoint_cb and self.resume is None
+                    and now - self.last_checkpoint > CHECKPOINT_INTERVAL_S):
+                self.last_checkpoint = now
+                self.checkpoint_cb()
+
+        min_next = 10**9
+        cand = self._children(state, blank_idx, prev_blank)
+        if self.resume is not None and (skip >= len(cand) or cand[skip][2] != self.resume[1][g]):
+            raise ValueError("checkpoint does not match this search")
+
+        for i, (_, nb, moved_tile, new_t) in enumerate(cand):
+            if i < skip:
+                continue
+            self.cursors[g] = i + 1
+            path_moves.append(moved_tile)
+            found, t = self.search(new_t, g + 1, bound, nb, blank_idx, path_moves)
+            if found:
+                return True, t
+            path_moves.pop()
+            if t < min_next:
+                min_next = t
+
+        return False, min_next
+
+# -----------------------------
+# Search-tree profiling
+# Opt-in: a SearchContext subclass that only overrides the per-node hooks,
+# so it profiles the production search, child ordering included.
+# -----------------------------
+
+PROFILE_TT_MAX = 1_000_000  # states remembered per iteration to count transpositions
+
+class ProfilingSearchContext(SearchContext):
+    def __init__(self, cancel: CancelFlag, progress_cb=None, heuristic=pdb_heuristic):
+        super().__init__(cancel, progress_cb, heuristic)
+        self.iterations: List[Dict[str, object]] = []
+        self.patterns = list(PDBS.keys())
+        self.pattern_sums = [0] * len(self.patterns)
+        self.pattern_nodes = 0
+        self.h_sum = 0
+        self.wd_sum = 0
+        self.track_wd = heuristic is wd_pdb_heuristic
+        self.seen = set()
+        self.seen_capped = False
+        self.it: Dict[str, object] = {}
+
+    def begin_iteration(self, bound: int):
+        size = bound + 2
+        self.it = {"bound": bound, "generated": [0] * size, "expanded": [0] * size,
+                   "pruned": [0] * size, "transpositions": [0] * size}
+        self.iterations.append(self.it)
+        self.seen = set()
+        if len(self.patterns) != len(PDBS):
+            # wd cold start picked up the PDBs: pattern means cover the iterations since then
+            self.patterns = list(PDBS.keys())
+            self.pattern_sums = [0] * len(self.patterns)
+            self.pattern_nodes = 0
+
+    def _on_prune(self, g: int, f: int):
+        super()._on_prune(g, f)
+        self.it["generated"][g] += 1
+        self.it["pruned"][g] += 1
+
+    def _on_expand(self, state: Tuple[int, ...], g: int, h: int):
+        it = self.it
+        it["generated"][g] += 1
+        it["expanded"][g] += 1
+        key = pack_state(state)
+        if key in self.seen:
+            it["transpositions"][g] += 1
+        elif len(self.seen) < PROFILE_TT_MAX:
+            self.seen.add(key)
+        else:
+            self.seen_capped = True
+        for k, v in enumerate(pdb_components(state)):
+            self.pattern_sums[k] += v
+        self.pattern_nodes += 1
+        self.h_sum += h
+        if self.track_wd:
+            self.wd_sum += wd_heuristic(state)
+
+    def report(self, start: List[int], path: Optional[List[int]]) -> Dict[str, object]:
+        iterations = []
+        prev_nodes = None
+        for k, it in enumerate(self.iterations):
+            gen = list(it["generated"])
+            if path and k == len(self.iterations) - 1:
+                gen[len(path)] += 1  # the goal node (neither pruned nor expanded)
+            depth = max((d for d, n in enumerate(gen) if n), default=0) + 1
+            gen, exp = gen[:depth], it["expanded"][:depth]
+            nodes = sum(exp)
+            iterations.append({
+                "bound": it["bound"],
+                "nodes": nodes,
+                "growth": round(nodes / prev_nodes, 3) if prev_nodes else None,
+                "generated": gen,
+                "expanded": exp,
+                "pruned": it["pruned"][:depth],
+                "transpositions": it["transpositions"][:depth],
+                # children generated per expanded node, depth by depth
+                "ebf": [round(gen[d + 1] / exp[d], 3) if exp[d] else None for d in range(depth - 1)],
+            })
+            prev_nodes = nodes
+
+        expanded = max(1, self.nodes)
+        report = {
+            "start": list(start),
+            "solution_len": len(path) if path is not None else None,
+            "nodes": self.nodes,
+            "iterations": iterations,
+            "transpositions": sum(sum(it["transpositions"]) for it in iterations),
+            "transpositions_capped": self.seen_capped,
+            "h_mean": round(self.h_sum / expanded, 3),
+            "patterns": [{"tiles": list(p), "mean": round(s_ / max(1, self.pattern_nodes), 3)}
+                         for p, s_ in zip(self.patterns, self.pattern_sums)],
+        }
+        if self.track_wd:
+            report["wd_mean"] = round(self.wd_sum / expanded, 3)
+
+        if path:
+            # h against the true remaining distance along the (optimal) solution, and
+            # where the solution move sat in the search's own child ordering
+            state = list(start)
+            along = []
+            prev_blank = -1
+            for i in range(len(path) + 1):
+                t = tuple(state)
+                rank = None
+                if i < len(path):
+                    z = state.index(0)
+                    cand = self._children(t, z, prev_blank)
+                    rank = next(k for k, c in enumerate(cand) if c[2] == path[i])
+                    p = state.index(path[i])
+                    state[z], state[p] = state[p], 0
+                    prev_blank = z
+                along.append({"depth": i, "h": self.heuristic(t), "remaining": len(path) - i,
+                              "components": pdb_components(t), "rank": rank})
+            errors: Dict[int, int] = {}
+            for row in along:
+                e = row["remaining"] - row["h"]
+                errors[e] = errors.get(e, 0) + 1
+            report["solution"] = along
+            report["h_error_hist"] = {str(k): v for k, v in sorted(errors.items())}
+            ranks = [r["rank"] for r in along if r["rank"] is not None]
+            report["ordering_rank_hist"] = {str(r): ranks.count(r) for r in sorted(set(ranks))}
+        return report
+
+def write_profile_report(profile: Dict[str, object], path: str, flame_path: Optional[str] = None):
+    """JSON report; flame_path additionally gets folded stacks (bound;g=0;…;g=d  nodes at depth d)."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(profile, f, indent=1)
+    if flame_path:
+        with open(flame_path, "w", encoding="utf-8") as f:
+            for it in profile["iterations"]:
+                stack = f"bound={it['bound']}"
+                for d, n in enumerate(it["expanded"]):
+                    stack += f";g={d}"
+                    if n:
+                        f.write(f"{stack} {n}\n")
+
 def ida_star_solve_pdb(
     start: List[int],
     cancel: CancelFlag,
-    progress_cb=None
+    progress_cb=None,
+    backend: str = "auto",
+    stats: Optional[Dict[str, object]] = None,
+    checkpoint: bool = False,
+    profile: Optional[Dict[str, object]] = None
 ) -> Optional[List[int]]:
-    ensure_pdbs_loaded(progress_cb=progress_cb, cancel_cb=cancel.is_cancelled)
+    """
+    backend: "auto" (JIT with numba, else batched with numpy, else Python) |
+             "python" | "jit" | "batched"
+    All IDA* backends expand moves in the same order and return the same move list.
+    Other engines (same optimal length, possibly a different path):
+             "astar" (memory-capped A*) | "ida_tt" (IDA* + transposition table) |
+             "wd" (Python IDA* on max(walking distance, loaded PDBs); never builds PDBs)
+    "auto" without PDB cache files solves with "wd" and builds the PDBs in a
+    background process instead of blocking on them.
+    stats: optional dict, filled with engine, node and memory figures.
+    checkpoint: resume from a saved checkpoint of this start state (if any) and
+    save one every CHECKPOINT_INTERVAL_S and on cancel (python/jit backends;
+    "auto" ignores it when it picks batched or the WD cold start, see
+    checkpoints_supported). Removed once the search finishes.
+    profile: optional dict, filled with search-tree statistics (see
+    ProfilingSearchContext.report); runs the python/wd search.
+    """
+    if checkpoint and backend not in ("auto", "python", "jit"):
+        raise ValueError(f"checkpoints need the python or jit backend, not {backend!r}")
+    if profile is not None:
+        if checkpoint or backend not in ("auto", "python", "wd"):
+            raise ValueError("profiling runs the python/wd search without checkpoints")
+        profile.clear()
+        if backend == "auto":
+            backend = "python" if pdbs_ready() else "auto"
+    if backend == "auto" and not pdbs_ready():
+        if progress_cb:
+            progress_cb("PDBs fehlen → Walking Distance, PDBs werden im Hintergrund gebaut…", 0, 0)
+        start_background_pdb_build()
+        backend, checkpoint = "wd", False
+    if backend != "wd":
+        ensure_pdbs_loaded(progress_cb=progress_cb, cancel_cb=cancel.is_cancelled)
+    if stats is None:
+        stats = {}
+    stats.clear()
+
+    if backend == "jit" or (backend == "auto" and HAVE_JIT and profile is None):
+        if not HAVE_JIT:
+            raise RuntimeError("JIT backend not available (numba/numpy missing)")
+        return _ida_star_solve_jit(start, cancel, progress_cb=progress_cb, stats=stats, checkpoint=checkpoint)
 
     start_t = tuple(start)
     goal_t = tuple(GOAL)
     if start_t == goal_t:
+        stats.update(engine=backend, nodes=0)
+        if profile is not None:
+            profile.update(ProfilingSearchContext(cancel).report(start, []))
+        return []
+
+    if backend == "batched" or (backend == "auto" and np is not None and profile is None):
+        return _ida_star_solve_batched(start, cancel, progress_cb=progress_cb, stats=stats)
+    if backend == "astar":
+        return astar_solve_pdb(start, cancel, progress_cb=progress_cb, stats=stats)
+    if backend == "ida_tt":
+        return ida_star_solve_tt(start, cancel, progress_cb=progress_cb, stats=stats)
+
+    context = SearchContext if profile is None else ProfilingSearchContext
+    if backend == "wd":
+        ensure_wd_table()
+        ctx = context(cancel, progress_cb, heuristic=wd_pdb_heuristic)
+    else:
+        ctx = context(cancel, progress_cb)
+    stats.update(engine=backend if backend == "wd" else "python")
+    search = ctx.search
+
+    bound = ctx.heuristic(start_t)
+    blank_idx = start_t.index(0)
+    path: List[int] = []
+
+    cp = load_checkpoint(start) if checkpoint else None
+    if cp is not None:
+        bound, ctx.nodes = cp["bound"], cp["nodes"]
+        if progress_cb:
+            progress_cb(f"Setze Suche fort… bound={bound} | Tiefe={len(cp['path'])}", 0, 0)
+    elif progress_cb:
+        progress_cb(f"Starte IDA*… initial bound={bound}", 0, 0)
+
+    def save():
+        g = len(path)
+        save_checkpoint(start, {"bound": bound, "min_next": ctx.iter_min, "nodes": ctx.nodes,
+                                "path": list(path), "cursors": ctx.cursors[:g + 1]})
+
+    if checkpoint:
+        ctx.checkpoint_cb = save
+
+    while True:
+        if cancel.is_cancelled():
+            if checkpoint and cp is None:
+                # between iterations: keep the bound reached so far
+                save_checkpoint(start, {"bound": bound, "min_next": 10**9, "nodes": ctx.nodes,
+                                        "path": [], "cursors": [0]})
+            raise RuntimeError("CANCELLED")
+
+        if backend == "wd" and len(PDBS) < len(PATTERNS) and pdbs_ready():
+            # background build done: from now on max(WD, PDB); bound stays a valid lower bound
+            ensure_pdbs_loaded(progress_cb=progress_cb)
+
+        if progress_cb:
+            progress_cb(f"IDA* Iteration… bound={bound}", 0, 0)
+
+        ctx.cursors = [0] * (bound + 2)
+        ctx.iter_min = 10**9
+        if profile is not None:
+            ctx.begin_iteration(bound)
+        if cp is not None:
+            ctx.iter_min, ctx.resume = cp["min_next"], (cp["cursors"], cp["path"])
+            cp = None
+
+        try:
+            found, t = search(start_t, 0, bound, blank_idx, -1, path)
+        except RuntimeError as e:
+            if profile is not None:
+                profile.update(ctx.report(start, None))  # partial: what ran until the cancel
+            if str(e) == "CANCELLED" and checkpoint and ctx.resume is None:
+                # save the parent with the child being entered not done yet
+                # (that child may be pruned on replay, so it cannot be on the path).
+                # While ctx.resume is set the saved path is still being replayed:
+                # the checkpoint on disk is further along, keep it.
+                if path:
+                    path.pop()
+                    ctx.cursors[len(path)] -= 1
+                else:
+                    ctx.cursors[0] = 0
+                save()
+            raise
+        except ValueError:
+            discard_checkpoint(start)
+            raise
+
+        stats["nodes"] = ctx.nodes
+        if profile is not None and (found or t == 10**9):
+            profile.update(ctx.report(start, path if found else None))
+        if found:
+            if checkpoint:
+                discard_checkpoint(start)
+            if progress_cb:
+                progress_cb(f"Lösung gefunden! Züge={len(path)}", 0, 0)
+            return path.copy()
+
+        t = min(t, ctx.iter_min)  # a resumed iteration skipped part of the tree
+        if t == 10**9:
+            if checkpoint:
+                discard_checkpoint(start)
+            return None
+        bound = t
+
+
+# -----------------------------
+# Optional JIT backend (Numba)
+# Same IDA* as above, as an explicit-stack DFS over NumPy arrays.
+# The kernel runs for a node budget and returns, so Python can poll the
+# CancelFlag and emit progress between calls. It releases the GIL, so solver
+# threads (e.g. solver_service.py) run in parallel.
+# -----------------------------
+
+JIT_NODE_BUDGET = 200_000
+
+# kernel status codes
+_JIT_BUDGET, _JIT_FOUND, _JIT_EXHAUSTED = 0, 1, 2
+
+if HAVE_JIT:
+    @njit(cache=True, nogil=True)
+    def _jit_heuristic(pos_of, pdbs, pat_flat, pat_start, w_flat):
+        h = 0
+        for k in range(len(pat_start) - 1):
+            a = pat_start[k]
+            b = pat_start[k + 1]
+            pdb = pdbs[k]
+            # slot 0 = blank, then the pattern tiles (same as rank_partial_perm)
+            used = 0
+            rank = 0
+            for i in range(b - a + 1):
+                if i == 0:
+                    p = pos_of[0]
+                else:
+                    p = pos_of[pat_flat[a + i - 1]]
+                below = used & ((1 << p) - 1)
+                c = p
+                while below:
+                    below &= below - 1
+                    c -= 1
+                used |= 1 << p
+                rank += c * w_flat[a + k + i]
+            d = pdb[rank]
+            if d != 65535:
+                h += d
+        return h
+
+    @njit(cache=True, nogil=True)
+    def _jit_expand(board, pos_of, pdbs, pat_flat, pat_start, w_flat, neighbors, n_nb,
+                    g, prev_blank, child_nb, child_h, child_n, cursor):
+        # children of the node at depth g, stably sorted by h (like cand.sort)
+        blank = pos_of[0]
+        k = 0
+        for j in range(n_nb[blank]):
+            nb = neighbors[blank, j]
+            if nb == prev_blank:
+                continue
+            tile = board[nb]
+            pos_of[tile] = blank
+            pos_of[0] = nb
+            h = _jit_heuristic(pos_of, pdbs, pat_flat, pat_start, w_flat)
+            pos_of[tile] = nb
+            pos_of[0] = blank
+
+            i = k
+            while i > 0 and child_h[g, i - 1] > h:
+                child_h[g, i] = child_h[g, i - 1]
+                child_nb[g, i] = child_nb[g, i - 1]
+                i -= 1
+            child_h[g, i] = h
+            child_nb[g, i] = nb
+            k += 1
+        child_n[g] = k
+        cursor[g] = 0
+
+    @njit(cache=True, nogil=True)
+    def _jit_ida_run(board, pos_of, goal, pdbs, pat_flat, pat_start, w_flat, neighbors, n_nb,
+                     path_blank, moves, child_nb, child_h, child_n, cursor, st, bound, budget):
+        # st = [depth, min_next, nodes]; all search state lives in the arrays,
+        # so a call can stop after `budget` nodes and the next call resumes.
+        g = st[0]
+        min_next = st[1]
+        nodes = st[2]
+        steps = 0
+        status = _JIT_BUDGET
+        while True:
+            if g < 0:
+                status = _JIT_EXHAUSTED
+                break
+            if steps >= budget:
+                break
+
+            c = cursor[g]
+            if c >= child_n[g]:
+                # all children done -> undo the move that led here
+                if g > 0:
+                    cur = path_blank[g]
+                    prev = path_blank[g - 1]
+                    tile = board[prev]
+                    board[cur] = tile
+                    board[prev] = 0
+                    pos_of[tile] = cur
+                    pos_of[0] = prev
+                g -= 1
+                continue
+
+            cursor[g] = c + 1
+            nb = child_nb[g, c]
+            f = g + 1 + child_h[g, c]
+            if f > bound:
+                if f < min_next:
+                    min_next = f
+                continue
+
+            blank = path_blank[g]
+            tile = board[nb]
+            board[blank] = tile
+            board[nb] = 0
+            pos_of[tile] = blank
+            pos_of[0] = nb
+            moves[g] = tile
+            g += 1
+            path_blank[g] = nb
+
+            if child_h[g - 1, c] == 0:
+                is_goal = True
+                for i in range(16):
+                    if board[i] != goal[i]:
+                        is_goal = False
+                        break
+                if is_goal:
+                    status = _JIT_FOUND
+                    break
+
+            nodes += 1
+            steps += 1
+            _jit_expand(board, pos_of, pdbs, pat_flat, pat_start, w_flat, neighbors, n_nb,
+                        g, path_blank[g - 1], child_nb, child_h, child_n, cursor)
+
+        st[0] = g
+        st[1] = min_next
+        st[2] = nodes
+        return status
+
+def _jit_tables():
+    """NumPy views (no copy) of PDBS + flattened pattern/weight tables for the kernel."""
+    patterns = list(PDBS.keys())
+    pdbs = tuple(np.frombuffer(PDBS[p], dtype=np.uint16) for p in patterns)
+    pat_flat, pat_start, w_flat = [], [0], []
+    for p in patterns:
+        pat_flat.extend(p)
+        pat_start.append(len(pat_flat))
+        m = 1 + len(p)
+        w_flat.extend(perm_count(16 - (i + 1), m - (i + 1)) for i in range(m))
+    neighbors = np.full((16, 4), -1, dtype=np.int64)
+    n_nb = np.zeros(16, dtype=np.int64)
+    for i, nbs in enumerate(NEIGHBORS):
+        neighbors[i, :len(nbs)] = nbs
+        n_nb[i] = len(nbs)
+    return (pdbs, np.array(pat_flat, dtype=np.int64), np.array(pat_start, dtype=np.int64),
+            np.array(w_flat, dtype=np.int64), neighbors, n_nb)
+
+def _ida_star_solve_jit(start: List[int], cancel: CancelFlag, progress_cb=None,
+                        stats: Optional[Dict[str, object]] = None,
+                        checkpoint: bool = False,
+                        node_budget: int = JIT_NODE_BUDGET) -> Optional[List[int]]:
+    stats = {} if stats is None else stats
+    stats.update(engine="jit", nodes=0)
+    start_t = tuple(start)
+    if start_t == tuple(GOAL):
         return []
 
-    # To show progress
+    pdbs, pat_flat, pat_start, w_flat, neighbors, n_nb = _jit_tables()
+    goal = np.array(GOAL, dtype=np.int64)
+
+    bound = pdb_heuristic(start_t)
     nodes = 0
-    last_ping = time.time()
+    last_ping = last_checkpoint = time.time()
 
-    def search(state: Tuple[int, ...], g: int, bound: int, blank_idx: int, prev_blank: int,
-               path_moves: List[int]) -> Tuple[bool, int]:
-        nonlocal nodes, last_ping
+    cp = load_checkpoint(start) if checkpoint else None
+    if cp is not None:
+        bound, nodes = cp["bound"], cp["nodes"]
+        if progress_cb:
+            progress_cb(f"Setze Suche fort (JIT)… bound={bound} | Tiefe={len(cp['path'])}", 0, 0)
+    elif progress_cb:
+        progress_cb(f"Starte IDA* (JIT)… initial bound={bound}", 0, 0)
+
+    while True:
+        if cancel.is_cancelled():
+            if checkpoint and cp is None:
+                save_checkpoint(start, {"bound": bound, "min_next": 10**9, "nodes": nodes,
+                                        "path": [], "cursors": [0]})
+            raise RuntimeError("CANCELLED")
+
+        if progress_cb:
+            progress_cb(f"IDA* Iteration… bound={bound}", 0, 0)
+
+        board = np.array(start, dtype=np.int64)
+        pos_of = np.zeros(16, dtype=np.int64)
+        for idx, v in enumerate(start):
+            pos_of[v] = idx
+        depth = bound + 2
+        path_blank = np.zeros(depth, dtype=np.int64)
+        moves = np.zeros(depth, dtype=np.int64)
+        child_nb = np.zeros((depth, 4), dtype=np.int64)
+        child_h = np.zeros((depth, 4), dtype=np.int64)
+        child_n = np.zeros(depth, dtype=np.int64)
+        cursor = np.zeros(depth, dtype=np.int64)
+        st = np.array([0, 10**9, nodes], dtype=np.int64)
+
+        path_blank[0] = pos_of[0]
+        _jit_expand(board, pos_of, pdbs, pat_flat, pat_start, w_flat, neighbors, n_nb,
+                    0, -1, child_nb, child_h, child_n, cursor)
+
+        if cp is not None:
+            # replay the saved path, re-expanding each level, then restore the cursors
+            saved_path, saved_cursors = cp["path"], cp["cursors"]
+            for d, tile in enumerate(saved_path):
+                c = saved_cursors[d] - 1
+                nb = child_nb[d, c] if 0 <= c < child_n[d] else -1
+                if nb < 0 or board[nb] != tile:
+                    discard_checkpoint(start)
+                    raise ValueError("checkpoint does not match this search")
+                blank = path_blank[d]
+                board[blank] = tile
+                board[nb] = 0
+                pos_of[tile] = blank
+                pos_of[0] = nb
+                moves[d] = tile
+                path_blank[d + 1] = nb
+                _jit_expand(board, pos_of, pdbs, pat_flat, pat_start, w_flat, neighbors, n_nb,
+                            d + 1, blank, child_nb, child_h, child_n, cursor)
+                cursor[d] = saved_cursors[d]
+            cursor[len(saved_path)] = saved_cursors[len(saved_path)]
+            st[0], st[1] = len(saved_path), cp["min_next"]
+            cp = None
+
+        def save():
+            g = int(st[0])
+            save_checkpoint(start, {"bound": bound, "min_next": int(st[1]), "nodes": int(st[2]),
+                                    "path": moves[:g].tolist(), "cursors": cursor[:g + 1].tolist()})
+
+        while True:
+            status = _jit_ida_run(board, pos_of, goal, pdbs, pat_flat, pat_start, w_flat,
+                                  neighbors, n_nb, path_blank, moves, child_nb, child_h,
+                                  child_n, cursor, st, bound, node_budget)
+            nodes = int(st[2])
+            stats["nodes"] = nodes
+            if status == _JIT_FOUND:
+                path = moves[:st[0]].tolist()
+                if checkpoint:
+                    discard_checkpoint(start)
+                if progress_cb:
+                    progress_cb(f"Lösung gefunden! Züge={len(path)}", 0, 0)
+                return path
+            if status == _JIT_EXHAUSTED:
+                break
+
+            if cancel.is_cancelled():
+                if checkpoint:
+                    save()
+                raise RuntimeError("CANCELLED")
+            now = time.time()
+            if progress_cb and (now - last_ping) > 0.2:
+                last_ping = now
+                progress_cb(f"Suche… bound={bound} | Tiefe={int(st[0])} | Knoten={nodes:,}", 0, 0)
+            if checkpoint and now - last_checkpoint > CHECKPOINT_INTERVAL_S:
+                last_checkpoint = now
+                save()
+
+        t = int(st[1])
+        if t == 10**9:
+            if checkpoint:
+                discard_checkpoint(start)
+            return None
+        bound = t
+
+
+# -----------------------------
+# Batched backend (NumPy)
+# Top levels of each IDA* iteration are expanded breadth-first as arrays of
+# packed states (4 bits per cell); ranks, PDB lookups and f > bound pruning
+# run for the whole level at once. The surviving frontier is then searched
+# depth-first (SearchContext). Children are kept in DFS order (parent, h,
+# move), so the result is the same move list as the other backends.
+# -----------------------------
+
+BATCH_FRONTIER_MAX = 50_000
+
+# blank moves in NEIGHBORS order: up, down, left, right (-1 = off board)
+_MOVE_DELTAS = (-N, N, -1, 1)
+_MOVE_TARGET = [[i + d if (i + d) in NEIGHBORS[i] else -1 for i in range(N * N)] for d in _MOVE_DELTAS]
 
+def pack_state(state) -> int:
+    out = 0
+    for i, v in enumerate(state):
+        out |= v << (4 * i)
+    return out
+
+def unpack_state(packed: int) -> Tuple[int, ...]:
+    return tuple((packed >> (4 * i)) & 0xF for i in range(16))
+
+def batch_pdb_heuristic(packed):
+    """Vectorized pdb_heuristic for a uint64 array of packed states."""
+    shifts = np.arange(16, dtype=np.uint64) * np.uint64(4)
+    cells = ((packed[:, None] >> shifts) & np.uint64(0xF)).astype(np.int8)
+    pos_of = np.argsort(cells, axis=1)  # pos_of[:, v] = cell of value v
+    h = np.zeros(len(packed), dtype=np.int64)
+    for pattern_tiles, pdb in PDBS.items():
+        pos = pos_of[:, [0] + list(pattern_tiles)]
+        m = pos.shape[1]
+        rank = np.zeros(len(packed), dtype=np.int64)
+        for i in range(m):
+            p = pos[:, i]
+            c = p.copy()
+            for j in range(i):
+                c -= pos[:, j] < p
+            rank += c * perm_count(16 - (i + 1), m - (i + 1))
+        d = np.frombuffer(pdb, dtype=np.uint16)[rank]
+        h += np.where(d != 65535, d, 0)
+    return h
+
+def _ida_star_solve_batched(start: List[int], cancel: CancelFlag, progress_cb=None,
+                            stats: Optional[Dict[str, object]] = None) -> Optional[List[int]]:
+    if np is None:
+        raise RuntimeError("batched backend needs numpy")
+
+    stats = {} if stats is None else stats
+    stats["engine"] = "batched"
+    ctx = SearchContext(cancel, progress_cb)
+    targets = np.array(_MOVE_TARGET, dtype=np.int64)
+    goal_packed = np.uint64(pack_state(GOAL))
+    root = np.array([pack_state(start)], dtype=np.uint64)
+
+    bound = pdb_heuristic(tuple(start))
+    if progress_cb:
+        progress_cb(f"Starte IDA* (Batch)… initial bound={bound}", 0, 0)
+
+    while True:
         if cancel.is_cancelled():
             raise RuntimeError("CANCELLED")
+        if progress_cb:
+            progress_cb(f"IDA* Iteration… bound={bound}", 0, 0)
 
-        h = pdb_heuristic(state)
+        min_next = 10**9
+        ctx.cursors = [0] * (bound + 2)
+        packed = root
+        blank = np.array([start.index(0)], dtype=np.int64)
+        prev = np.array([-1], dtype=np.int64)
+        parents: List = []  # per level: index into previous level
+        tiles: List = []    # per level: moved tile
+
+        def path_to(level_idx: int) -> List[int]:
+            out = []
+            for parent, tile in zip(reversed(parents), reversed(tiles)):
+                out.append(int(tile[level_idx]))
+                level_idx = parent[level_idx]
+            return out[::-1]
+
+        g = 0
+        found = None
+        while g < bound and 0 < len(packed) < BATCH_FRONTIER_MAX:
+            if cancel.is_cancelled():
+                raise RuntimeError("CANCELLED")
+            par, dirs, nbs = [], [], []
+            for k in range(4):
+                tgt = targets[k][blank]
+                ok = np.nonzero((tgt >= 0) & (tgt != prev))[0]
+                par.append(ok)
+                dirs.append(np.full(len(ok), k, dtype=np.int64))
+                nbs.append(tgt[ok])
+            par = np.concatenate(par)
+            dirs = np.concatenate(dirs)
+            nb = np.concatenate(nbs)
+
+            src = packed[par]
+            sh_nb = (nb * 4).astype(np.uint64)
+            sh_blank = (blank[par] * 4).astype(np.uint64)
+            tile = (src >> sh_nb) & np.uint64(0xF)
+            child = src - (tile << sh_nb) + (tile << sh_blank)
+
+            h = batch_pdb_heuristic(child)
+            f = g + 1 + h
+            pruned = f > bound
+            if pruned.any():
+                min_next = min(min_next, int(f[pruned].min()))
+
+            keep = np.nonzero(~pruned)[0]
+            order = keep[np.lexsort((dirs[keep], h[keep], par[keep]))]
+
+            packed = child[order]
+            prev = blank[par[order]]
+            blank = nb[order]
+            parents.append(par[order])
+            tiles.append(tile[order].astype(np.int64))
+            ctx.nodes += len(order)
+            g += 1
+
+            hit = np.nonzero(packed == goal_packed)[0]
+            if len(hit):
+                found = path_to(int(hit[0]))
+                break
+
+        if found is None:
+            for i in range(len(packed)):
+                path = path_to(i)
+                ok, t = ctx.search(unpack_state(int(packed[i])), g, bound, int(blank[i]), int(prev[i]), path)
+                if ok:
+                    found = path
+                    break
+                if t < min_next:
+                    min_next = t
+
+        stats["nodes"] = ctx.nodes
+        if found is not None:
+            if progress_cb:
+                progress_cb(f"Lösung gefunden! Züge={len(found)}", 0, 0)
+            return found
+
+        if min_next == 10**9:
+            return None
+        bound = min_next
+
+
+# -----------------------------
+# Alternative engines: IDA* + transposition table, memory-capped A*
+# Both use the PDB heuristic and stay optimal; states are packed into one
+# int (4 bits per cell) for compact tables.
+# -----------------------------
+
+TT_SIZE = 1 << 20            # slots (14 bytes each)
+ASTAR_MAX_NODES = 2_000_000  # stored states before A* hands over to IDA* + TT
+
+class TTSearchContext(SearchContext):
+    """
+    IDA* with a fixed-size transposition table. After a failed subtree the
+    table learns h' = t - g for (state, previous blank); later visits and
+    iterations prune with max(PDB, h'). Replacement: a slot is overwritten
+    when the new entry's subtree took at least as much work.
+    """
+    def __init__(self, cancel: CancelFlag, progress_cb=None, size: int = TT_SIZE):
+        super().__init__(cancel, progress_cb)
+        self.size = size
+        self.keys = array('Q', [0]) * size  # 0 = empty (no real state packs to 0)
+        self.prev = array('b', [0]) * size
+        self.hval = array('B', [0]) * size
+        self.work = array('I', [0]) * size
+        self.lookups = self.tt_hits = self.stores = self.replacements = 0
+
+    def memory_bytes(self) -> int:
+        return self.size * (8 + 1 + 1 + 4)
+
+    def _slot(self, key: int) -> int:
+        # low bits of a packed state are just the first cells -> mix first
+        return (((key * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 24) % self.size
+
+    def _lookup(self, key: int, prev_blank: int) -> int:
+        self.lookups += 1
+        i = self._slot(key)
+        if self.keys[i] == key and self.prev[i] == prev_blank:
+            self.tt_hits += 1
+            return self.hval[i]
+        return 0
+
+    def _store(self, key: int, prev_blank: int, h: int, work: int):
+        i = self._slot(key)
+        h = min(h, 255)
+        work = min(work, 0xFFFFFFFF)
+        if self.keys[i] == key and self.prev[i] == prev_blank:
+            if h > self.hval[i]:
+                self.hval[i] = h
+            self.work[i] = max(self.work[i], work)
+            return
+        if self.keys[i] != 0:
+            if work < self.work[i]:
+                return
+            self.replacements += 1
+        self.keys[i] = key
+        self.prev[i] = prev_blank
+        self.hval[i] = h
+        self.work[i] = work
+        self.stores += 1
+
+    def search(self, state: Tuple[int, ...], g: int, bound: int, blank_idx: int, prev_blank: int,
+               path_moves: List[int]) -> Tuple[bool, int]:
+        if self.cancel.is_cancelled():
+            raise RuntimeError("CANCELLED")
+
+        key = pack_state(state)
+        h = max(pdb_heuristic(state), self._lookup(key, prev_blank))
         f = g + h
         if f > bound:
             return False, f
-        if state == goal_t:
+        if state == self.goal_t:
             return True, g
 
-        nodes += 1
+        self.nodes += 1
+        start_nodes = self.nodes
         now = time.time()
-        if progress_cb and (now - last_ping) > 0.2:
-            last_ping = now
-            progress_cb(f"Suche… bound={bound} | Tiefe={g} | Knoten={nodes:,}", 0, 0)
+        if self.progress_cb and (now - self.last_ping) > 0.2:
+            self.last_ping = now
+            self.progress_cb(f"Suche (TT)… bound={bound} | Tiefe={g} | Knoten={self.nodes:,}", 0, 0)
 
         min_next = 10**9
-
-        # Small ordering: try moves that reduce heuristic first (simple greedy ordering)
-        # Compute candidate neighbor list with their resulting heuristic (cheap enough).
-        cand = []
-        for nb in NEIGHBORS[blank_idx]:
-            if nb == prev_blank:
-                continue
-            moved_tile = state[nb]
-            new_state = list(state)
-            new_state[blank_idx], new_state[nb] = new_state[nb], new_state[blank_idx]
-            new_t = tuple(new_state)
-            cand.append((pdb_heuristic(new_t), nb, moved_tile, new_t))
-        cand.sort(key=lambda x: x[0])
-
-        for _, nb, moved_tile, new_t in cand:
+        for _, nb, moved_tile, new_t in self._children(state, blank_idx, prev_blank):
             path_moves.append(moved_tile)
-            found, t = search(new_t, g + 1, bound, nb, blank_idx, path_moves)
+            found, t = self.search(new_t, g + 1, bound, nb, blank_idx, path_moves)
             if found:
                 return True, t
             path_moves.pop()
             if t < min_next:
                 min_next = t
 
+        # no solution within bound below this node: cost-to-go >= min_next - g
+        self._store(key, prev_blank, min_next - g, self.nodes - start_nodes)
         return False, min_next
 
-    bound = pdb_heuristic(start_t)
+    def _child_h(self, state: Tuple[int, ...], prev_blank: int) -> int:
+        return max(pdb_heuristic(state), self._lookup(pack_state(state), prev_blank))
+
+def ida_star_solve_tt(start: List[int], cancel: CancelFlag, progress_cb=None,
+                      stats: Optional[Dict[str, object]] = None, tt_size: int = TT_SIZE,
+                      initial_bound: int = 0) -> Optional[List[int]]:
+    ensure_pdbs_loaded(progress_cb=progress_cb, cancel_cb=cancel.is_cancelled)
+    stats = {} if stats is None else stats
+    stats["engine"] = "ida_tt"
+    start_t = tuple(start)
+    if start_t == tuple(GOAL):
+        stats["nodes"] = 0
+        return []
+
+    ctx = TTSearchContext(cancel, progress_cb, tt_size)
+    bound = max(pdb_heuristic(start_t), initial_bound)
     blank_idx = start_t.index(0)
     path: List[int] = []
 
     if progress_cb:
-        progress_cb(f"Starte IDA*… initial bound={bound}", 0, 0)
+        progress_cb(f"Starte IDA* + TT… initial bound={bound}", 0, 0)
 
     while True:
         if cancel.is_cancelled():
             raise RuntimeError("CANCELLED")
-
         if progress_cb:
             progress_cb(f"IDA* Iteration… bound={bound}", 0, 0)
 
-        try:
-            found, t = search(start_t, 0, bound, blank_idx, -1, path)
-        except RuntimeError as e:
-            if str(e) == "CANCELLED":
-                raise
-            raise
-
+        found, t = ctx.search(start_t, 0, bound, blank_idx, -1, path)
+        stats.update(
+            nodes=stats.get("astar_nodes", 0) + ctx.nodes,
+            tt_slots=ctx.size, tt_stores=ctx.stores, tt_replacements=ctx.replacements,
+            tt_hits=ctx.tt_hits, tt_lookups=ctx.lookups,
+            memory_bytes=max(stats.get("memory_bytes", 0), ctx.memory_bytes()),
+        )
         if found:
             if progress_cb:
                 progress_cb(f"Lösung gefunden! Züge={len(path)}", 0, 0)
@@ -341,6 +1897,542 @@ def ida_star_solve_pdb(
             return None
         bound = t
 
+# per stored state: packed key (64-bit int) + g/parent value; per heap entry:
+# the (f, -g, packed) tuple + its -g (f is a cached small int, packed is the dict key)
+_ASTAR_ENTRY_BYTES = sys.getsizeof(1 << 63) + sys.getsizeof(80 << 5)
+_ASTAR_HEAP_BYTES = sys.getsizeof((0, 0, 0)) + sys.getsizeof(-80)
+
+def _astar_memory_bytes(info: Dict[int, int], heap: List) -> int:
+    return (sys.getsizeof(info) + len(info) * _ASTAR_ENTRY_BYTES
+            + sys.getsizeof(heap) + len(heap) * _ASTAR_HEAP_BYTES)
+
+def astar_solve_pdb(start: List[int], cancel: CancelFlag, progress_cb=None,
+                    stats: Optional[Dict[str, object]] = None,
+                    max_nodes: int = ASTAR_MAX_NODES) -> Optional[List[int]]:
+    """
+    A* with a compact table packed_state -> g * 32 + parent blank (16 = root).
+    If the table reaches max_nodes, the smallest open f is a proven lower
+    bound; A* frees its tables and IDA* + TT continues from that bound.
+    """
+    import heapq
+    ensure_pdbs_loaded(progress_cb=progress_cb, cancel_cb=cancel.is_cancelled)
+    stats = {} if stats is None else stats
+    stats["engine"] = "astar"
+
+    start_p = pack_state(start)
+    goal_p = pack_state(GOAL)
+    info = {start_p: 16}
+    heap = [(pdb_heuristic(tuple(start)), 0, start_p)]  # (f, -g, packed): deeper first on ties
+    expanded = 0
+    last_ping = time.time()
+
+    if progress_cb:
+        progress_cb(f"Starte A*… h={heap[0][0]} (max {max_nodes:,} Zustände)", 0, 0)
+
+    while heap:
+        f, neg_g, p = heapq.heappop(heap)
+        g = -neg_g
+        v = info[p]
+        if v >> 5 != g:
+            continue  # stale heap entry
+        if p == goal_p:
+            path = []
+            state = list(unpack_state(p))
+            while (v & 31) != 16:
+                blank = state.index(0)
+                parent_blank = v & 31
+                path.append(state[parent_blank])
+                state[blank], state[parent_blank] = state[parent_blank], 0
+                v = info[pack_state(state)]
+            path.reverse()
+            stats.update(nodes=expanded, peak_entries=len(info),
+                         memory_bytes=_astar_memory_bytes(info, heap))
+            if progress_cb:
+                progress_cb(f"Lösung gefunden! Züge={len(path)}", 0, 0)
+            return path
+
+        if len(info) >= max_nodes:
+            stats.update(astar_nodes=expanded, peak_entries=len(info),
+                         memory_bytes=_astar_memory_bytes(info, heap),
+                         fallback_bound=f)
+            info.clear()
+            heap.clear()
+            if progress_cb:
+                progress_cb(f"A*: Speichergrenze erreicht → IDA* + TT ab bound={f}", 0, 0)
+            moves = ida_star_solve_tt(start, cancel, progress_cb=progress_cb, stats=stats, initial_bound=f)
+            stats["engine"] = "astar+ida_tt"
+            return moves
+
+        expanded += 1
+        if expanded % 1024 == 0:
+            if cancel.is_cancelled():
+                raise RuntimeError("CANCELLED")
+            now = time.time()
+            if progress_cb and (now - last_ping) > 0.2:
+                last_ping = now
+                progress_cb(f"A*… f={f} | offen={len(heap):,} | gespeichert={len(info):,}", 0, 0)
+
+        state = list(unpack_state(p))
+        blank = state.index(0)
+        parent_blank = v & 31
+        for nb in NEIGHBORS[blank]:
+            if nb == parent_blank:
+                continue
+            state[blank], state[nb] = state[nb], 0
+            cp = pack_state(state)
+            old = info.get(cp)
+            if old is None or (old >> 5) > g + 1:
+                info[cp] = ((g + 1) << 5) | blank
+                heapq.heappush(heap, (g + 1 + pdb_heuristic(tuple(state)), -(g + 1), cp))
+            state[nb], state[blank] = state[blank], 0
+
+    stats.update(nodes=expanded, peak_entries=len(info), memory_bytes=_astar_memory_bytes(info, heap))
+    return None
+
+
+# -----------------------------
+# Instance Generator (corpus for load tests)
+# -----------------------------
+
+def random_solvable_state(rng: random.Random) -> List[int]:
+    """
+    Uniformly random solvable 4x4 state.
+    Shuffling hits each permutation equally often; swapping two tiles maps the
+    unsolvable half 1:1 onto the solvable half, so the result stays uniform.
+    """
+    state = list(range(16))
+    rng.shuffle(state)
+    if not is_solvable_4x4(state):
+        a, b = [i for i, v in enumerate(state) if v != 0][:2]
+        state[a], state[b] = state[b], state[a]
+    return state
+
+def sample_state_in_h_band(rng: random.Random, min_h: int, max_h: int,
+                           walk_limit: int = 400, max_tries: int = 10000) -> List[int]:
+    """
+    State whose PDB heuristic lies in [min_h, max_h].
+    First a uniform sample is tried; if it misses the band (typical for low
+    bands), a random walk from GOAL is followed until it passes through the band.
+    Walk-based samples are reproducible but not uniform within the band.
+    """
+    for _ in range(max_tries):
+        cand = random_solvable_state(rng)
+        if min_h <= pdb_heuristic(tuple(cand)) <= max_h:
+            return cand
+
+        state = GOAL.copy()
+        zero_idx = state.index(0)
+        last = None
+        for _ in range(walk_limit):
+            nbs = [nb for nb in NEIGHBORS[zero_idx] if nb != last]
+            nxt = rng.choice(nbs)
+            state[zero_idx], state[nxt] = state[nxt], state[zero_idx]
+            last = zero_idx
+            zero_idx = nxt
+            h = pdb_heuristic(tuple(state))
+            if min_h <= h <= max_h:
+                return state
+            if h > max_h:
+                break
+    raise RuntimeError(f"no state with h in [{min_h}, {max_h}] after {max_tries} tries")
+
+# h is a lower bound and in practice only a few moves below the optimum.
+# Candidates for an optimal-length band [lo, hi] get a random h floor in
+# [lo - OPT_H_SLACK, hi], so we do not spend IDA* runs on hopeless states.
+OPT_H_SLACK = 8
+OPT_MAX_TRIES = 1000  # IDA* runs per "optimal" instance before giving up on the band
+
+def generate_instance(seed, index: int, mode: str = "uniform",
+                      band: Optional[Tuple[int, int]] = None,
+                      cancel: Optional[CancelFlag] = None) -> Dict[str, object]:
+    """
+    One corpus entry, fully determined by (seed, index, mode, band).
+    mode: "uniform" | "h" (PDB heuristic in band) | "optimal" (optimal length in band)
+    """
+    rng = random.Random(f"{seed}:{index}")
+    ensure_pdbs_loaded()
+
+    optimal = None
+    if mode == "uniform":
+        state = random_solvable_state(rng)
+    elif mode == "h":
+        state = sample_state_in_h_band(rng, band[0], band[1])
+    elif mode == "optimal":
+        lo, hi = band
+        cancel = cancel or CancelFlag()
+        for _ in range(OPT_MAX_TRIES):
+            h_floor = rng.randint(max(0, lo - OPT_H_SLACK), hi)
+            state = sample_state_in_h_band(rng, h_floor, hi)
+            moves = ida_star_solve_pdb(state, cancel)
+            if moves is not None and lo <= len(moves) <= hi:
+                optimal = len(moves)
+                break
+        else:
+            raise RuntimeError(f"no state with optimal length in [{lo}, {hi}] after {OPT_MAX_TRIES} tries")
+    else:
+        raise ValueError(f"unknown mode: {mode}")
+
+    return {
+        "index": index,
+        "state": state,
+        "h": pdb_heuristic(tuple(state)),
+        "optimal": optimal,
+    }
+
+def _generate_instance_job(args):
+    return generate_instance(*args)
+
+def generate_corpus(path: str, count: int, seed, mode: str = "uniform",
+                    band: Optional[Tuple[int, int]] = None, processes: int = 1,
+                    progress_cb=None) -> int:
+    """
+    Write `count` instances as JSON lines to `path`, ordered by index.
+    Work is spread over `processes` worker processes; the output does not
+    depend on the number of processes.
+    """
+    if mode != "uniform" and band is None:
+        raise ValueError(f"mode {mode!r} needs a band (lo, hi)")
+
+    jobs = [(seed, i, mode, band) for i in range(count)]
+    done = 0
+    registry = None
+    with open(path, "w", encoding="utf-8") as f:
+        if processes <= 1:
+            ensure_pdbs_loaded(progress_cb=progress_cb)
+            results = map(_generate_instance_job, jobs)
+            pool = None
+        else:
+            import multiprocessing
+            # Workers attach to one shared copy of the PDBs instead of loading their own
+            registry = SharedPDBRegistry(f"pdbgen_{os.getpid()}").publish(progress_cb=progress_cb).install()
+            pool = multiprocessing.Pool(processes, initializer=attach_shared_pdbs, initargs=(registry.name,))
+            results = pool.imap(_generate_instance_job, jobs, chunksize=4)
+        try:
+            for entry in results:
+                f.write(json.dumps(entry) + "\n")
+                done += 1
+                if progress_cb:
+                    progress_cb(f"Generator: {done}/{count} Instanzen", done, count)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+            if registry is not None:
+                registry.close(unlink=True)
+    return done
+
+
+# -----------------------------
+# Hints: solution cache + budgeted lookahead
+# -----------------------------
+
+HINT_BUDGET_MS = 50
+# JIT kernel slice for hints: the deadline is only checked between slices
+# (~1.2k nodes/ms -> a slice takes about 1/12 of the budget)
+HINT_JIT_NODES_PER_MS = 100
+SOLUTION_CACHE_MAX = 100_000  # cached states (each with its optimal remaining moves)
+
+_SOLUTION_CACHE = None  # OrderedDict packed_state -> remaining moves, LRU
+_SOLUTION_LOCK = threading.Lock()  # hints run on several threads (solver_service.py)
+
+def _solution_cache():
+    global _SOLUTION_CACHE
+    if _SOLUTION_CACHE is None:
+        from collections import OrderedDict
+        _SOLUTION_CACHE = OrderedDict()
+    return _SOLUTION_CACHE
+
+def remember_solution(start: List[int], moves: List[int]):
+    """Cache an optimal solution: every state along it gets its optimal suffix."""
+    keys = []
+    state = list(start)
+    for k in range(len(moves) + 1):
+        keys.append(pack_state(state))
+        if k < len(moves):
+            z = state.index(0)
+            t = state.index(moves[k])
+            state[z], state[t] = moves[k], 0
+    with _SOLUTION_LOCK:
+        cache = _solution_cache()
+        for k, key in enumerate(keys):
+            cache[key] = moves[k:]
+            cache.move_to_end(key)
+        while len(cache) > SOLUTION_CACHE_MAX:
+            cache.popitem(last=False)
+
+def cached_solution(state: List[int]) -> Optional[List[int]]:
+    key = pack_state(state)
+    with _SOLUTION_LOCK:
+        cache = _solution_cache()
+        moves = cache.get(key)
+        if moves is not None:
+            cache.move_to_end(key)
+    return moves
+
+class DeadlineFlag(CancelFlag):
+    def __init__(self, seconds: float):
+        super().__init__()
+        self.deadline = time.perf_counter() + seconds
+    def is_cancelled(self) -> bool:
+        return self._cancel or time.perf_counter() > self.deadline
+
+def hint_next_move(state: List[int], budget_ms: float = HINT_BUDGET_MS) -> Dict[str, object]:
+    """
+    Best next tile to move within ~budget_ms.
+    Returns {"tile", "optimal", "source": "goal"|"cache"|"solve"|"lookahead", "remaining"}.
+    "optimal" is True only when the move lies on a proven optimal solution.
+    """
+    if state == GOAL:
+        return {"tile": None, "optimal": True, "source": "goal", "remaining": 0}
+
+    moves = cached_solution(state)
+    if moves:
+        return {"tile": moves[0], "optimal": True, "source": "cache", "remaining": len(moves)}
+
+    # Never build PDBs here (minutes) – without cache files fall back to walking distance
+    heuristic = pdb_heuristic
+    if not pdbs_ready():
+        backend, heuristic = "wd", wd_pdb_heuristic
+    else:
+        ensure_pdbs_loaded()
+        # A JIT kernel that is not compiled yet would blow the budget; the Python
+        # search checks the deadline at every node, the batched one only per level
+        backend = "jit" if HAVE_JIT and _jit_ida_run.signatures else "python"
+
+    deadline = DeadlineFlag(budget_ms / 1000.0)
+    try:
+        if backend == "jit":
+            moves = _ida_star_solve_jit(state, deadline,
+                                        node_budget=max(1_000, int(budget_ms * HINT_JIT_NODES_PER_MS)))
+        else:
+            moves = ida_star_solve_pdb(state, deadline, backend=backend)
+    except RuntimeError as e:
+        if str(e) != "CANCELLED":
+            raise
+        moves = None
+    if moves:
+        remember_solution(state, moves)
+        return {"tile": moves[0], "optimal": True, "source": "solve", "remaining": len(moves)}
+
+    # Out of time: two-ply lookahead. Backed-up lower bound via this move is
+    # max(1 + h1, min over grandchildren of 2 + h2); ties go to the lower h1.
+    z = state.index(0)
+    best = None
+    for nb in NEIGHBORS[z]:
+        child = list(state)
+        child[z], child[nb] = child[nb], 0
+        h1 = heuristic(tuple(child))
+        f2 = 10**9
+        for nb2 in NEIGHBORS[nb]:
+            if nb2 == z:
+                continue
+            grand = list(child)
+            grand[nb], grand[nb2] = grand[nb2], 0
+            f2 = min(f2, 2 + heuristic(tuple(grand)))
+        score = (max(1 + h1, f2) if child != GOAL else 0, h1)
+        if best is None or score < best[0]:
+            best = (score, state[nb])
+    return {"tile": best[1], "optimal": False, "source": "lookahead", "remaining": None}
+
+
+# -----------------------------
+# Out-of-process solver
+# The search runs in its own interpreter, so it does not share the GIL
+# with the GUI. The worker publishes (or attaches to) the PDBs as a
+# SharedPDBRegistry, streams progress over a pipe and stays alive for
+# later solves; cancel terminates the process.
+# -----------------------------
+
+PROCESS_PROGRESS_MS = 50  # min. interval between progress messages from the worker
+
+def _solver_process_main(conn, registry_name: str):
+    import signal
+    job_id = None
+    last = 0.0
+    running: Optional[CancelFlag] = None
+
+    def on_term(signum, frame):
+        # SolverProcess.cancel(): let a running search write its checkpoint first
+        if running is None:
+            os._exit(0)  # like the default SIGTERM: no finalizers on the shared-memory views
+        running.cancel()
+
+    signal.signal(signal.SIGTERM, on_term)
+
+    def pcb(msg, a=0, b=0):
+        nonlocal last
+        now = time.perf_counter()
+        if now - last >= PROCESS_PROGRESS_MS / 1000:
+            last = now
+            conn.send(("progress", job_id, msg))
+
+    registry = None
+
+    def share_pdbs(build: bool):
+        # Attach/publish once the tables exist. Without cache files and build=False
+        # nothing happens: "auto" solves on walking distance meanwhile.
+        nonlocal registry
+        if registry is not None:
+            return
+        try:
+            registry = SharedPDBRegistry(registry_name).attach().install()
+        except FileNotFoundError:
+            if not build and not pdbs_ready():
+                return
+            registry = SharedPDBRegistry(registry_name).publish(progress_cb=pcb).install()
+        conn.send(("ready", None, None))
+
+    while True:
+        try:
+            share_pdbs(build=False)
+            req = conn.recv()
+        except EOFError:
+            return
+        except Exception as e:
+            conn.send(("error", None, f"PDB: {e}"))
+            return
+        if req[0] == "stop":
+            if registry is not None:
+                registry.close()
+            return
+        _, job_id, state, backend, checkpoint = req
+        running = CancelFlag()
+        try:
+            share_pdbs(build=backend != "auto")
+            moves = ida_star_solve_pdb(state, running, progress_cb=pcb, backend=backend, checkpoint=checkpoint)
+            conn.send(("done", job_id, moves))
+        except Exception as e:
+            if running.is_cancelled():
+                os._exit(0)  # terminated by the owner, checkpoint is written
+            conn.send(("error", job_id, str(e)))
+        running = None
+
+class SolverProcess:
+    """
+    One reusable solver process, driven from a single thread:
+    submit() a job, poll() for ("progress"|"done"|"error", payload) events,
+    cancel() to kill it. solve() is a blocking wrapper for scripts.
+    """
+
+    def __init__(self, registry_name: Optional[str] = None):
+        self.registry_name = registry_name or PDB_SHM_NAME or f"pdbsolver_{os.getpid()}"
+        self._owns_registry = not (registry_name or PDB_SHM_NAME)
+        self._proc = None
+        self._conn = None
+        self._published = False  # a worker finished publishing the registry once
+        self._registry: Optional[SharedPDBRegistry] = None  # our own attachment (hints etc.)
+        self._next_id = 0
+        self.job_id: Optional[int] = None
+
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.is_alive()
+
+    def _spawn(self):
+        import multiprocessing
+        ctx = multiprocessing.get_context("spawn")  # never fork a process that runs Qt
+        self._conn, child = ctx.Pipe()
+        self._proc = ctx.Process(target=_solver_process_main, args=(child, self.registry_name), daemon=True)
+        self._proc.start()
+        child.close()
+
+    def _reap(self):
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+        self._proc = None
+        self.job_id = None
+
+    def submit(self, state: List[int], backend: str = "auto", checkpoint: bool = False) -> int:
+        if self.job_id is not None:
+            raise RuntimeError("solver process is busy")
+        if not self.alive():
+            self._reap()
+            self._spawn()
+        if backend == "auto" and not pdbs_ready():
+            start_background_pdb_build()  # outlives worker restarts; the worker solves on WD
+        self._next_id += 1
+        self.job_id = self._next_id
+        self._conn.send(("solve", self.job_id, list(state), backend, checkpoint))
+        return self.job_id
+
+    def poll(self) -> List[Tuple[str, object]]:
+        events = []
+        if self._conn is None:
+            return events
+        try:
+            while self._conn.poll():
+                kind, job_id, payload = self._conn.recv()
+                if kind == "ready":
+                    self._published = True
+                    if self._registry is None and any(p not in PDBS for p in PATTERNS):
+                        self._registry = SharedPDBRegistry(self.registry_name).attach().install()
+                elif job_id is not None and job_id != self.job_id:
+                    continue
+                elif kind == "progress":
+                    events.append((kind, payload))
+                else:
+                    self.job_id = None
+                    events.append((kind, payload))
+        except (EOFError, OSError):
+            # worker is gone (crash, OOM killer)
+            busy = self.job_id is not None
+            self._reap()
+            if busy:
+                events.append(("error", "solver process died"))
+        return events
+
+    def cancel(self):
+        """
+        Hard cancel: terminate the worker; the next submit() starts a fresh one.
+        A running search gets up to a second to write its checkpoint (posix).
+        """
+        if self._proc is None:
+            return
+        self._proc.terminate()
+        self._proc.join(1.0)
+        if self._proc.is_alive():
+            self._proc.kill()
+            self._proc.join()
+        if not self._published and self._owns_registry:
+            # killed while publishing: half-made segments / lock file
+            SharedPDBRegistry(self.registry_name).discard()
+        self._reap()
+
+    def solve(self, state: List[int], backend: str = "auto", progress_cb=None,
+              timeout: Optional[float] = None, checkpoint: bool = False) -> Optional[List[int]]:
+        self.submit(state, backend, checkpoint)
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            for kind, payload in self.poll():
+                if kind == "progress":
+                    if progress_cb:
+                        progress_cb(payload)
+                elif kind == "done":
+                    return payload
+                else:
+                    raise RuntimeError(payload)
+            if deadline is not None and time.perf_counter() > deadline:
+                self.cancel()
+                raise RuntimeError("CANCELLED")
+            if self._conn is not None:
+                self._conn.poll(0.05)
+
+    def close(self):
+        if self.alive() and self.job_id is None:
+            try:
+                self._conn.send(("stop",))
+                self._proc.join(1.0)
+            except OSError:
+                pass
+        if self.alive():
+            self.cancel()
+        self._reap()
+        if self._registry is not None:
+            self._registry.close()
+            self._registry = None
+        if self._owns_registry:
+            SharedPDBRegistry(self.registry_name).discard()
+
 
 # -----------------------------
 # Worker Thread
@@ -350,9 +2442,11 @@ class SolverWorker(QObject):
     progress = Signal(str)
     finished = Signal(object, str)  # moves (list or None), status string: "ok"|"cancelled"|"fail"
 
-    def __init__(self, start_state: List[int]):
+    def __init__(self, start_state: List[int], backend: str = "auto", checkpoint: bool = False):
         super().__init__()
         self.start_state = start_state
+        self.backend = backend
+        self.checkpoint = checkpoint
         self.cancel_flag = CancelFlag()
 
     @Slot()
@@ -361,7 +2455,8 @@ class SolverWorker(QObject):
             def pcb(msg, a=0, b=0):
                 self.progress.emit(msg)
 
-            moves = ida_star_solve_pdb(self.start_state, self.cancel_flag, progress_cb=pcb)
+            moves = ida_star_solve_pdb(self.start_state, self.cancel_flag, progress_cb=pcb,
+                                       backend=self.backend, checkpoint=self.checkpoint)
             if moves is None:
                 self.finished.emit(None, "fail")
             else:
@@ -378,11 +2473,58 @@ class SolverWorker(QObject):
         self.cancel_flag.cancel()
 
 
+class ProcessSolverWorker(QObject):
+    """Same signals as SolverWorker; the search runs in a (reused) SolverProcess."""
+    progress = Signal(str)
+    finished = Signal(object, str)
+
+    POLL_MS = 20
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.proc = SolverProcess()
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.POLL_MS)
+        self._timer.timeout.connect(self._poll)
+
+    def solve(self, state: List[int], backend: str = "auto", checkpoint: bool = False):
+        self.proc.submit(state, backend, checkpoint)
+        self._timer.start()
+
+    @Slot()
+    def _poll(self):
+        last_msg = None
+        for kind, payload in self.proc.poll():
+            if kind == "progress":
+                last_msg = payload
+                continue
+            self._timer.stop()
+            if kind == "done":
+                self.finished.emit(payload, "ok" if payload is not None else "fail")
+            else:
+                self.finished.emit(None, "fail")
+            return
+        if last_msg is not None:
+            self.progress.emit(last_msg)  # only the newest message per tick
+
+    def cancel(self):
+        self._timer.stop()
+        self.proc.cancel()
+        # queued, so the caller finishes its own UI update first
+        QTimer.singleShot(0, lambda: self.finished.emit(None, "cancelled"))
+
+    def close(self):
+        self._timer.stop()
+        self.proc.close()
+
+
 # -----------------------------
 # GUI
 # -----------------------------
 
 class SlidingPuzzle(QWidget):
+    solver_progress = Signal(str)  # solver progress as delivered to the GUI (e.g. for gui_bench.py)
+
     TILE = 62
     GAP = 8
     PAD = 12
@@ -394,6 +2536,10 @@ class SlidingPuzzle(QWidget):
     BTN_W = 110
     BTN_H = 32
 
+    SOLVER_BACKEND = "auto"
+    SOLVER_IN_PROCESS = os.environ.get("SOLVER_PROCESS", "1") != "0"  # 0: QThread in this interpreter
+    CHECKPOINTS = True  # save the search on Stop/close, offer to resume it
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("4x4 Schiebe-Puzzel")
@@ -412,6 +2558,7 @@ class SlidingPuzzle(QWidget):
         # solver thread state
         self._solver_thread: Optional[QThread] = None
         self._solver_worker: Optional[SolverWorker] = None
+        self._solver_process: Optional[ProcessSolverWorker] = None
         self._solving = False
 
         self._image_mode = False
@@ -475,7 +2622,7 @@ class SlidingPuzzle(QWidget):
         r1.addWidget(self.btn_shuffle)
         r1.addStretch(1)
 
-        # Ebene 2: Auto lösen + Stop
+        # Ebene 2: Auto lösen + Tipp + Stop
         r2 = QHBoxLayout()
         controls.addLayout(r2)
         r2.addStretch(1)
@@ -483,6 +2630,10 @@ class SlidingPuzzle(QWidget):
         self.btn_solve.clicked.connect(self.on_solve)
         r2.addWidget(self.btn_solve)
 
+        self.btn_hint = QPushButton("Tipp")
+        self.btn_hint.clicked.connect(self.on_hint)
+        r2.addWidget(self.btn_hint)
+
         self.btn_stop = QPushButton("Stop")
         self.btn_stop.clicked.connect(self.on_stop)
         self.btn_stop.setEnabled(False)
@@ -517,7 +2668,7 @@ class SlidingPuzzle(QWidget):
         r4.addStretch(1)
 
         self._set_buttons_equal_size([
-            self.btn_set, self.btn_shuffle, self.btn_solve, self.btn_stop,
+            self.btn_set, self.btn_shuffle, self.btn_solve, self.btn_hint, self.btn_stop,
             self.btn_reset, self.btn_log, self.btn_img_load, self.btn_img_clear
         ])
 
@@ -612,6 +2763,7 @@ class SlidingPuzzle(QWidget):
         self.btn_set.setEnabled(enabled)
         self.btn_shuffle.setEnabled(enabled)
         self.btn_solve.setEnabled(enabled)
+        self.btn_hint.setEnabled(enabled)
         self.btn_reset.setEnabled(enabled)
         self.btn_img_load.setEnabled(enabled)
         self.btn_img_clear.setEnabled(enabled and self._image_mode)
@@ -653,11 +2805,13 @@ class SlidingPuzzle(QWidget):
         )
         if not path:
             return
+        if not self.load_image(path):
+            QMessageBox.warning(self, "Fehler", "Konnte das Bild nicht laden.")
 
+    def load_image(self, path: str) -> bool:
         pm = QPixmap(path)
         if pm.isNull():
-            QMessageBox.warning(self, "Fehler", "Konnte das Bild nicht laden.")
-            return
+            return False
 
         self._base_image = pm
         self._image_mode = True
@@ -666,6 +2820,7 @@ class SlidingPuzzle(QWidget):
         self._slice_image_into_tiles()
         self._apply_tile_appearance()
         self._log(f"--- BILD GELADEN: {path} ---")
+        return True
 
     def on_clear_image(self):
         if self._animating or self._auto_playing or self._solving:
@@ -793,6 +2948,31 @@ class SlidingPuzzle(QWidget):
             return
         self._apply_move_by_tile_value(tile_value, from_auto=False)
 
+    # ---------- Hint ----------
+
+    def on_hint(self):
+        if self._animating or self._auto_playing or self._solving:
+            return
+
+        hint = hint_next_move(self.state)
+        tile = hint["tile"]
+        if tile is None:
+            self.status.setText("✅ Zielzustand erreicht!")
+            return
+
+        if hint["optimal"]:
+            text = f"💡 Tipp: {tile} schieben (optimal, noch {hint['remaining']} Züge)"
+        else:
+            text = f"💡 Tipp: {tile} schieben (Schätzung)"
+        self.status.setText(text)
+        self._log(f"[TIPP] {tile} ({hint['source']})")
+        self._flash_tile(tile)
+
+    def _flash_tile(self, tile_value: int):
+        btn = self.tiles[tile_value]
+        btn.setStyleSheet(btn.styleSheet() + "QPushButton#tile { border: 3px solid #f59e0b; }")
+        QTimer.singleShot(700, self._apply_tile_appearance)
+
     # ---------- Buttons ----------
 
     def on_set_state(self):
@@ -848,7 +3028,7 @@ class SlidingPuzzle(QWidget):
 
     # ----- Threaded solver -----
 
-    def _start_solver_thread(self):
+    def _start_solver_thread(self, checkpoint: bool = False):
         self._solving = True
         self.progress.setVisible(True)
         self.progress.setRange(0, 0)  # busy
@@ -856,8 +3036,17 @@ class SlidingPuzzle(QWidget):
         self.status.setText("🧠 Suche läuft… (du kannst Stop drücken)")
         self._log("--- SOLVER: gestartet ---")
 
+        if self.SOLVER_IN_PROCESS:
+            if self._solver_process is None:
+                self._solver_process = ProcessSolverWorker(self)
+                self._solver_process.progress.connect(self._on_solver_progress)
+                self._solver_process.finished.connect(self._on_solver_finished)
+            self._solver_worker = self._solver_process
+            self._solver_process.solve(self.state.copy(), self.SOLVER_BACKEND, checkpoint)
+            return
+
         self._solver_thread = QThread(self)
-        self._solver_worker = SolverWorker(self.state.copy())
+        self._solver_worker = SolverWorker(self.state.copy(), self.SOLVER_BACKEND, checkpoint)
         self._solver_worker.moveToThread(self._solver_thread)
 
         self._solver_thread.started.connect(self._solver_worker.run)
@@ -874,6 +3063,7 @@ class SlidingPuzzle(QWidget):
     @Slot(str)
     def _on_solver_progress(self, msg: str):
         self.status.setText(msg)
+        self.solver_progress.emit(msg)
 
     @Slot(object, str)
     def _on_solver_finished(self, moves_obj, status: str):
@@ -886,7 +3076,10 @@ class SlidingPuzzle(QWidget):
 
         if status == "cancelled":
             self._log("--- SOLVER: abgebrochen ---")
-            self.status.setText("⏹️ Suche abgebrochen.")
+            if self.CHECKPOINTS and load_checkpoint(self.state) is not None:
+                self.status.setText("⏹️ Suche abgebrochen – Zwischenstand gespeichert.")
+            else:
+                self.status.setText("⏹️ Suche abgebrochen.")
             self.btn_stop.setEnabled(False)
             if not self._animating and not self._auto_playing:
                 self._set_controls_enabled(True)
@@ -913,6 +3106,7 @@ class SlidingPuzzle(QWidget):
             self._set_controls_enabled(True)
             return
 
+        remember_solution(self.state, moves)
         self._log(f"--- AUTO SOLVE (PDB+IDA*): {len(moves)} Züge ---")
         self._pending_moves = moves
         self._auto_playing = True
@@ -931,11 +3125,24 @@ class SlidingPuzzle(QWidget):
             QMessageBox.warning(self, "Unlösbar", "Diese Ausgangslage ist unlösbar.")
             return
 
+        checkpoint = self.CHECKPOINTS and checkpoints_supported(self.SOLVER_BACKEND)
+        if checkpoint:
+            cp = load_checkpoint(self.state)
+            if cp is not None:
+                res = QMessageBox.question(
+                    self, "Zwischenstand gefunden",
+                    f"Für diese Stellung gibt es einen gespeicherten Suchstand "
+                    f"(bound={cp['bound']}, {cp['nodes']:,} Knoten).\nSuche fortsetzen?",
+                    QMessageBox.Yes | QMessageBox.No
+                )
+                if res != QMessageBox.Yes:
+                    discard_checkpoint(self.state)
+
         # disable controls while solving
         self._set_controls_enabled(False)
         self.btn_stop.setEnabled(True)
 
-        self._start_solver_thread()
+        self._start_solver_thread(checkpoint)
 
     def _play_next_move(self):
         if not self._auto_playing or self._animating:
@@ -979,6 +3186,8 @@ class SlidingPuzzle(QWidget):
             if self._solver_thread is not None:
                 self._solver_thread.quit()
                 self._solver_thread.wait(500)
+            if self._solver_process is not None:
+                self._solver_process.close()
         except Exception:
             pass
         super().closeEvent(event)
@@ -0,0 +1,53 @@
+import argparse
+import sys
+import time
+
+from main import (
+    CancelFlag, ensure_pdbs_loaded, generate_instance, ida_star_solve_pdb, write_profile_report
+)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Profiliert den IDA*-Suchbaum (Knoten je Iteration/Tiefe, Pruning, EBF, Heuristik-Fehler).")
+    ap.add_argument("state", nargs="?", help="Startstellung, 16 Zahlen kommagetrennt (0 = Lücke)")
+    ap.add_argument("--seed", default="profile")
+    ap.add_argument("--index", type=int, default=0)
+    ap.add_argument("--band", default="30-34", help="PDB-Heuristik-Band der Instanz (ohne state)")
+    ap.add_argument("--backend", choices=["python", "wd"], default="python")
+    ap.add_argument("-o", "--out", default="search_profile.json")
+    ap.add_argument("--flame", help="zusätzlich gefaltete Stacks (flamegraph.pl / speedscope)")
+    args = ap.parse_args()
+
+    if args.state:
+        state = [int(v) for v in args.state.split(",")]
+    else:
+        lo, _, hi = args.band.partition("-")
+        state = generate_instance(args.seed, args.index, "h", (int(lo), int(hi or lo)))["state"]
+    if args.backend == "python":
+        ensure_pdbs_loaded()
+
+    profile = {}
+    t0 = time.perf_counter()
+    moves = ida_star_solve_pdb(state, CancelFlag(), backend=args.backend, profile=profile)
+    dt = time.perf_counter() - t0
+    write_profile_report(profile, args.out, args.flame)
+
+    print(f"Züge={len(moves) if moves is not None else '-'}  Knoten={profile['nodes']:,}  Zeit={dt:.2f}s")
+    print(f"{'bound':>5} {'Knoten':>12} {'Wachstum':>8} {'gepruned':>12} {'Transp.':>10}  EBF (Tiefe 1..5)")
+    for it in profile["iterations"]:
+        growth = f"{it['growth']:.2f}" if it["growth"] else "-"
+        ebf = " ".join(f"{b:.2f}" for b in it["ebf"][:5] if b is not None)
+        print(f"{it['bound']:>5} {it['nodes']:>12,} {growth:>8} {sum(it['pruned']):>12,} "
+              f"{sum(it['transpositions']):>10,}  {ebf}")
+    if "h_error_hist" in profile:
+        print("Heuristik-Fehler entlang der Lösung (rest - h: Anzahl):",
+              ", ".join(f"{k}: {v}" for k, v in profile["h_error_hist"].items()))
+        print("Rang des Lösungszugs in der Zugsortierung:",
+              ", ".join(f"{k}: {v}" for k, v in profile["ordering_rank_hist"].items()))
+    print("Mittelwert je Pattern:", ", ".join(f"{p['tiles']}: {p['mean']}" for p in profile["patterns"]))
+    print(f"Bericht: {args.out}" + (f", Flame: {args.flame}" if args.flame else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+"""
+Local solver service: JSON lines over TCP (default 127.0.0.1:8765).
+
+Requests (one JSON object per line, answers carry the same "id"):
+  {"op": "solve", "id": "a1", "state": [16 ints], "deadline": 5.0}
+  {"op": "cancel", "id": "a1"}
+  {"op": "hint", "id": "h1", "state": [16 ints], "budget_ms": 50}
+  {"op": "metrics"}
+
+Solve answers: {"id", "status": "ok"|"cancelled"|"timeout"|"unsolvable"|"rejected"|"fail",
+                "moves", "queue_ms", "solve_ms"}
+"""
+import argparse
+import asyncio
+import json
+import socket
+import sys
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from main import (
+    HINT_BUDGET_MS, CancelFlag, ensure_pdbs_loaded, hint_next_move, ida_star_solve_pdb, is_solvable_4x4
+)
+
+
+def percentiles(values, ps=(50, 90, 99)) -> Dict[str, float]:
+    if not values:
+        return {f"p{p}": 0.0 for p in ps}
+    s = sorted(values)
+    return {f"p{p}": round(s[min(len(s) - 1, int(len(s) * p / 100))], 2) for p in ps}
+
+
+def _valid_state(state) -> bool:
+    return (isinstance(state, list) and all(type(v) is int for v in state)
+            and sorted(state) == list(range(16)))
+
+
+class SolveJob:
+    def __init__(self, job_id: str, state: List[int], deadline: Optional[float]):
+        self.id = job_id
+        self.state = state
+        self.deadline = deadline
+        self.cancel_flag = CancelFlag()
+        self.timed_out = False
+        self.started = False
+        self.enqueued = time.perf_counter()
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class SolverService:
+    def __init__(self, workers: int = 2, queue_size: int = 64, backend: str = "auto"):
+        self.workers = workers
+        self.backend = backend
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.jobs: Dict[str, SolveJob] = {}
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="solver")
+        self.running = 0
+        self.counts: Dict[str, int] = {}
+        self.queue_ms = deque(maxlen=1000)
+        self.solve_ms = deque(maxlen=1000)
+        self.total_ms = deque(maxlen=1000)
+
+    async def start(self, host: str, port: int):
+        loop = asyncio.get_running_loop()
+        # PDBs are loaded once and shared by all solver threads
+        await loop.run_in_executor(None, ensure_pdbs_loaded)
+        for _ in range(self.workers):
+            asyncio.create_task(self._worker())
+        return await asyncio.start_server(self._handle_client, host, port)
+
+    # ---------- worker pool ----------
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job: SolveJob = await self.queue.get()
+            try:
+                if job.future.done():
+                    continue  # answered while still queued (deadline / cancel)
+                if job.cancel_flag.is_cancelled():
+                    self._finish(job, "timeout" if job.timed_out else "cancelled")
+                    continue
+
+                job.started = True
+                self.running += 1
+                started = time.perf_counter()
+                try:
+                    moves = await loop.run_in_executor(
+                        self.executor, ida_star_solve_pdb, job.state, job.cancel_flag, None, self.backend
+                    )
+                    status = "ok" if moves is not None else "fail"
+                except RuntimeError as e:
+                    if str(e) == "CANCELLED":
+                        status = "timeout" if job.timed_out else "cancelled"
+                    else:
+                        status = "fail"
+                    moves = None
+                except Exception:
+                    status, moves = "fail", None
+                finally:
+                    self.running -= 1
+                self._finish(job, status, moves, started)
+            finally:
+                self.queue.task_done()
+
+    def _finish(self, job: SolveJob, status: str, moves=None, started: Optional[float] = None):
+        now = time.perf_counter()
+        queue_ms = ((started or now) - job.enqueued) * 1000
+        solve_ms = (now - started) * 1000 if started else 0.0
+        self.counts[status] = self.counts.get(status, 0) + 1
+        self.queue_ms.append(queue_ms)
+        if started:
+            self.solve_ms.append(solve_ms)
+        self.total_ms.append((now - job.enqueued) * 1000)
+        self.jobs.pop(job.id, None)
+        if not job.future.done():
+            job.future.set_result({
+                "id": job.id, "status": status, "moves": moves,
+                "queue_ms": round(queue_ms, 2), "solve_ms": round(solve_ms, 2),
+            })
+
+    # ---------- requests ----------
+
+    async def _solve(self, req) -> dict:
+        job_id = str(req.get("id") or uuid.uuid4().hex)
+        state = req.get("state")
+        if not _valid_state(state):
+            return {"id": job_id, "status": "fail", "error": "state must be 16 distinct ints 0..15"}
+        if not is_solvable_4x4(state):
+            return {"id": job_id, "status": "unsolvable"}
+        if job_id in self.jobs:
+            return {"id": job_id, "status": "rejected", "error": "duplicate id"}
+        deadline = req.get("deadline")
+        if deadline is not None:
+            deadline = float(deadline)  # bad values fail the request before anything is queued
+
+        job = SolveJob(job_id, state, deadline)
+        try:
+            self.queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.counts["rejected"] = self.counts.get("rejected", 0) + 1
+            return {"id": job_id, "status": "rejected", "error": "queue full"}
+        self.jobs[job_id] = job
+
+        if job.deadline is not None:
+            def expire():
+                job.timed_out = True
+                job.cancel_flag.cancel()
+                if not job.started:
+                    self._finish(job, "timeout")
+            timer = asyncio.get_running_loop().call_later(job.deadline, expire)
+            job.future.add_done_callback(lambda _: timer.cancel())
+
+        try:
+            return await job.future
+        except asyncio.CancelledError:
+            job.cancel_flag.cancel()
+            raise
+
+    def _cancel(self, req) -> dict:
+        job = self.jobs.get(str(req.get("id")))
+        if job is None:
+            return {"id": req.get("id"), "status": "unknown"}
+        job.cancel_flag.cancel()
+        if not job.started:
+            self._finish(job, "cancelled")
+        return {"id": job.id, "status": "cancelling"}
+
+    async def _hint(self, req) -> dict:
+        state = req.get("state")
+        if not _valid_state(state):
+            return {"id": req.get("id"), "status": "fail", "error": "state must be 16 distinct ints 0..15"}
+        # outside the solver pool: hints are budgeted and must not wait behind long solves
+        hint = await asyncio.get_running_loop().run_in_executor(
+            None, hint_next_move, state, float(req.get("budget_ms", HINT_BUDGET_MS))
+        )
+        return {"id": req.get("id"), "status": "ok", **hint}
+
+    def metrics(self) -> dict:
+        return {
+            "queue_depth": self.queue.qsize(),
+            "running": self.running,
+            "workers": self.workers,
+            "counts": dict(self.counts),
+            "queue_ms": percentiles(self.queue_ms),
+            "solve_ms": percentiles(self.solve_ms),
+            "total_ms": percentiles(self.total_ms),
+        }
+
+    async def _dispatch(self, req) -> dict:
+        op = req.get("op")
+        if op == "solve":
+            return await self._solve(req)
+        if op == "cancel":
+            return self._cancel(req)
+        if op == "hint":
+            return await self._hint(req)
+        if op == "metrics":
+            return self.metrics()
+        return {"id": req.get("id"), "status": "fail", "error": f"unknown op: {op}"}
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # Requests of one connection run concurrently (a cancel must not wait for its solve)
+        lock = asyncio.Lock()
+        tasks = set()
+
+        async def answer(line: bytes):
+            try:
+                resp = await self._dispatch(json.loads(line))
+            except (ValueError, TypeError, AttributeError) as e:
+                resp = {"status": "fail", "error": f"bad request: {e}"}
+            except Exception as e:  # never leave the client without an answer
+                resp = {"status": "fail", "error": f"{type(e).__name__}: {e}"}
+            async with lock:
+                writer.write((json.dumps(resp) + "\n").encode())
+                await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    t = asyncio.create_task(answer(line))
+                    tasks.add(t)
+                    t.add_done_callback(tasks.discard)
+        except ConnectionError:
+            pass
+        finally:
+            # client gone: its pending solves are not needed anymore
+            for t in tasks:
+                t.cancel()
+            writer.close()
+
+
+# -----------------------------
+# Client stub (blocking)
+# -----------------------------
+
+class SolverClient:
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, timeout: Optional[float] = None):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.rfile = self.sock.makefile("rb")
+
+    def _call(self, req: dict) -> dict:
+        self.sock.sendall((json.dumps(req) + "\n").encode())
+        line = self.rfile.readline()
+        if not line:
+            raise ConnectionError("solver service closed the connection")
+        return json.loads(line)
+
+    def solve(self, state: List[int], deadline: Optional[float] = None, request_id: Optional[str] = None) -> dict:
+        req = {"op": "solve", "id": request_id or uuid.uuid4().hex, "state": list(state)}
+        if deadline is not None:
+            req["deadline"] = deadline
+        return self._call(req)
+
+    def cancel(self, request_id: str) -> dict:
+        # use a separate client: this one is blocked while its solve() is running
+        return self._call({"op": "cancel", "id": request_id})
+
+    def hint(self, state: List[int], budget_ms: float = HINT_BUDGET_MS) -> dict:
+        return self._call({"op": "hint", "state": list(state), "budget_ms": budget_ms})
+
+    def metrics(self) -> dict:
+        return self._call({"op": "metrics"})
+
+    def close(self):
+        self.rfile.close()
+        self.sock.close()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Lokaler Solver-Dienst (JSON Lines über TCP).")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("-w", "--workers", type=int, default=2)
+    ap.add_argument("-q", "--queue-size", type=int, default=64)
+    ap.add_argument("--backend", choices=["auto", "python", "jit"], default="auto")
+    args = ap.parse_args()
+
+    async def run():
+        service = SolverService(args.workers, args.queue_size, args.backend)
+        server = await service.start(args.host, args.port)
+        print(f"Solver-Dienst läuft auf {args.host}:{args.port} ({args.workers} Worker)", file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()